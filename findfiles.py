@@ -5,6 +5,7 @@ import json
 import fnmatch
 import argparse
 import logging
+import re
 import time
 
 import os
@@ -106,26 +107,21 @@ def list_folders(base_path,
     return sorted(results, key=natural_key)
 
 
-def list_files(base_path,
+def natural_key(s):
+    # Split string into list of strings and integers for natural sort
+    return [int(text) if text.isdigit() else text.lower() for text in re.split(r'(\d+)', s)]
+
+
+def iter_files(base_path,
                include_files=None,
                exclude_files=None,
                include_folders=None,
                exclude_folders=None):
     """
-    List files recursively with filtering.
-    
-    Args:
-        base_path: Path to search from
-        include_files: List of file patterns to include (pre-normalized)
-        exclude_files: List of file patterns to exclude (pre-normalized)
-        include_folders: List of folder patterns to include (pre-normalized)
-        exclude_folders: List of folder patterns to exclude (pre-normalized)
-    
-    Returns:
-        List of file paths sorted naturally
+    Yield matching files recursively as they are found, in directory walk order.
+    Same filtering as list_files, but without sorting, so callers can start working
+    on the first files while the tree is still being walked.
     """
-    files = []
-
     # Single file - output it directly as if it was found in a folder
     if os.path.isfile(base_path):
         abs_path = os.path.abspath(base_path)
@@ -138,7 +134,8 @@ def list_files(base_path,
             print("File excluded by file filter: " + str(base_path))
             sys.exit(1)
         # For single file input, ignore include filters - the user explicitly specified this file
-        return [abs_path]
+        yield abs_path
+        return
 
     # Handle partial path (e.g., c:\temp\fileprefix* to find files matching pattern)
     if not os.path.exists(base_path):
@@ -168,12 +165,33 @@ def list_files(base_path,
                 continue
             if include_files and not file_matches(full_path, include_files):
                 continue
-            files.append(full_path)
+            yield full_path
+
+
+def list_files(base_path,
+               include_files=None,
+               exclude_files=None,
+               include_folders=None,
+               exclude_folders=None):
+    """
+    List files recursively with filtering.
+    
+    Args:
+        base_path: Path to search from
+        include_files: List of file patterns to include (pre-normalized)
+        exclude_files: List of file patterns to exclude (pre-normalized)
+        include_folders: List of folder patterns to include (pre-normalized)
+        exclude_folders: List of folder patterns to exclude (pre-normalized)
+    
+    Returns:
+        List of file paths sorted naturally
+    """
+    files = list(iter_files(base_path,
+                            include_files=include_files,
+                            exclude_files=exclude_files,
+                            include_folders=include_folders,
+                            exclude_folders=exclude_folders))
 
-    import re
-    def natural_key(s):
-        # Split string into list of strings and integers for natural sort
-        return [int(text) if text.isdigit() else text.lower() for text in re.split(r'(\d+)', s)]
     if len(files) == 0:
         print("Did not find any files in subfolders of: " + str(base_path))
         sys.exit(1)
@@ -8,6 +8,10 @@ import argparse
 import os
 import time
 import logging
+import json
+import codecs
+import locale
+from typing import Callable
 
 
 # Set up logging
@@ -41,13 +45,13 @@ stderr_handler.addFilter(OnlyErrorFilter())
 logger.addHandler(stdout_handler)
 logger.addHandler(stderr_handler)
 
-logging.info(f"Startup")
 
-
-def apply_rules(command_line: str, args) -> str:
+def make_transformer(args) -> Callable[[str], str]:
     """
-    Apply transformation rules to the FFmpeg command line.
-    Each rule is a regex substitution.
+    Build the transformation rules for the given options once and return
+    a function that applies them to an FFmpeg command line.
+    Only the enabled rules are compiled in, so a worker handling many jobs
+    with the same options (see serve()) pays the setup cost only once.
     """
     additional_options = args.additional_options
     if  (not additional_options):
@@ -57,28 +61,35 @@ def apply_rules(command_line: str, args) -> str:
     replace_output = args.replace_output
     assume_source_fps = args.assume_source_fps
     
-    insert_filter = "," + args.insert_filter if args.insert_filter != "" else ""
-    hwupload_cuda_insertion = ",hwupload_cuda" if args.insert_hwupload_cuda else ""
-
-    insert_filter += hwupload_cuda_insertion
+    filter_parts = []
+    if args.insert_filter:
+        filter_parts.append(args.insert_filter)
+    if args.insert_hwupload_cuda:
+        filter_parts.append("hwupload_cuda")
+    insert_filter = ("," + ",".join(filter_parts)) if filter_parts else ""
+
+    # Literal string replacements (not regex) from --search-replace arguments, to handle commas safely
+    literal_rules = [tuple(pair) for pair in (args.search_replace or [])]
+    for search_value, replace_value in literal_rules:
+        logging.debug(f"Literal replacement rule: '{search_value}' -> '{replace_value}'")
 
     rules = []
-    
-    # Add search and replace rules from --search-replace arguments
-    if hasattr(args, 'search_replace') and args.search_replace:
-        for search_replace_pair in args.search_replace:
-            search_value, replace_value = search_replace_pair
-            # Use literal string replacement (not regex) to handle commas safely
-            rules.append(('literal', search_value, replace_value))
+
+    # Tokenize additional_options once; exact token match also keeps -g apart from e.g. -groupof
+    additional_opts = set(additional_options.split())
+
+    # All rules are matched in a single scan over the command (see transform), so instead of
+    # consuming the space in front of an option they only look behind for it: a space eaten by
+    # one removal must still be there for the option that follows it.
     #if additional_options contains -cq, remove "-b:v .+? "
-    if (additional_options.find("-cq") != -1):
-        rules.append((r" -b:v .+? ", " "))
+    if "-cq" in additional_opts:
+        rules.append((r"(?<= )-b:v .+? ", ""))
 
-    if (additional_options.find("-preset") != -1):
-        rules.append((r" -preset .+? ", " "))
+    if "-preset" in additional_opts:
+        rules.append((r"(?<= )-preset .+? ", ""))
 
-    if (additional_options.find(" -g .+? ") != -1):
-        rules.append((r" -g .+? ", " "))
+    if "-g" in additional_opts:
+        rules.append((r"(?<= )-g .+? ", ""))
 
     if (insert_filter != ""):
         # Insert the specified filters AND hwupload_cuda filter as last video filter before [vstr1]
@@ -86,46 +97,108 @@ def apply_rules(command_line: str, args) -> str:
 
     if args.prepend_audio_filter != "":
         # Prepend audio filter before each [astrX] where X is any number
-        rules.append((r"\[astr(\d+)\]", f",{args.prepend_audio_filter}[astr\\1]"))
+        rules.append((r"\[astr(?P<astr>\d+)\]", f",{args.prepend_audio_filter}[astr\\g<astr>]"))
 
     if args.remove_shortest:
         # Remove -shortest flag from command
-        rules.append((r" -shortest ", " "))
+        rules.append((r"(?<= )-shortest ", ""))
 
     #as a last thing, replace libx264 with h264_nvenc plus additional options
-    rules.append((r"-c:v libx264", " -c:v h264_nvenc " + additional_options + " "))
-
-    modified = command_line
-    for rule in rules:
-        if rule[0] == 'literal':
-            # Literal string replacement (not regex)
-            _, search_value, replace_value = rule
-            modified = modified.replace(search_value, replace_value)
-            logging.debug(f"Applied literal replacement: '{search_value}' -> '{replace_value}'")
-        else:
-            # Regex replacement (original behavior)
-            pattern, replacement = rule[0], rule[1]
-            modified = re.sub(pattern, replacement, modified, count=1)
+    # whole tokens only, so e.g. "-c:v libx264rgb" is left alone instead of turning into "h264_nvenc ... rgb"
+    rules.append((r"(?<!\S)-c:v libx264(?!\S)", " -c:v h264_nvenc " + additional_options + " "))
 
     # If assume_source_fps is provided, insert -r <fps> before -i
     if assume_source_fps:
-        modified = re.sub(r' -i "', f' -r {assume_source_fps} -i "', modified, count=1)
+        rules.append((r'(?<= )-i "', f'-r {assume_source_fps} -i "'))
 
-    # If bmx_cmd is provided, replace the part after the last pipe with bmx_cmd
-    if bmx_cmd:
-        # Escape backslashes in bmx_cmd for safe use in replacement string
-        bmx_cmd_escaped = bmx_cmd.replace("\\", "\\\\")
-        # Match the last pipe (not followed by another pipe) and everything after it
-        modified = re.sub(r"\|(?!.*\|).*$", f"| {bmx_cmd_escaped}", modified, flags=re.DOTALL)
+    # One alternation with a named group per rule, transform() dispatches on the group that matched
+    combined_rules = re.compile("|".join(f"(?P<r{i}>{pattern})" for i, (pattern, _) in enumerate(rules)))
+    replacements = [replacement for _, replacement in rules]
 
-    # If replace_output is provided, replace the output file in the command
+    # If replace_output is provided, replace the output file (last token) with replace_output
+    output_rule = None
     if replace_output:
-        # Replace the output file (last token) with replace_output
         # Escape backslashes in replace_output for safe use in replacement string
         replace_output_escaped = replace_output.replace("\\", "\\\\")
-        modified = re.sub(r"\"[^\"]*\"$", f'"{replace_output_escaped}"', modified)
+        output_rule = (re.compile(r"\"[^\"]*\"$"), f'"{replace_output_escaped}"')
+
+    def transform(command_line: str) -> str:
+        modified = command_line
+        for search_value, replace_value in literal_rules:
+            modified = modified.replace(search_value, replace_value)
+
+        # Each rule replaces only its first match, like a re.sub(count=1) per rule but in one pass
+        applied = set()
+        def dispatch(match):
+            rule = int(match.lastgroup[1:])
+            if rule in applied:
+                return match.group(0)
+            applied.add(rule)
+            return match.expand(replacements[rule])
+        modified = combined_rules.sub(dispatch, modified)
+        logging.debug(f"Applied {len(applied)} regex substitution(s)")
+
+        # If bmx_cmd is provided, replace the part after the last pipe with bmx_cmd
+        if bmx_cmd:
+            # Cut at the last pipe, rfind is linear where a "no later pipe" lookahead regex is quadratic
+            idx = modified.rfind("|")
+            if idx != -1:
+                modified = modified[:idx] + f"| {bmx_cmd}"
+
+        if output_rule:
+            modified = output_rule[0].sub(output_rule[1], modified)
+
+        return modified.strip()
 
-    return modified.strip()
+    return transform
+
+
+def apply_rules(command_line: str, args) -> str:
+    """
+    Apply transformation rules to the FFmpeg command line.
+    Each rule is a regex substitution.
+    """
+    return make_transformer(args)(command_line)
+
+
+def read_cmd_file(path) -> str:
+    """
+    Read a command file in one go as bytes and decode once, strictly: a command with replaced
+    characters would point ffmpeg at wrong paths. Files that are not utf-8 (e.g. written in the
+    Windows ANSI codepage) are decoded with the locale encoding, with a warning.
+    Raises ValueError if neither works.
+    """
+    data = Path(path).read_bytes()
+    try:
+        return data.decode('utf-8').strip()
+    except UnicodeDecodeError as e:
+        fallback = locale.getpreferredencoding(False)
+        if codecs.lookup(fallback).name == 'utf-8':
+            raise ValueError(f"Command file {path} is not valid utf-8: {e}") from e
+        try:
+            text = data.decode(fallback)
+        except UnicodeDecodeError:
+            raise ValueError(f"Command file {path} is neither utf-8 nor {fallback}: {e}") from e
+        logging.warning(f"Command file {path} is not utf-8 ({e}), decoded as {fallback}")
+        return text.strip()
+
+
+def read_bmx_cmd(original_cmd: str, args):
+    """
+    Check the bmx related options against the command and return the bmx cmd to pipe into (None without --bmx_cmd_file).
+    Raises ValueError for combinations the transformation cannot handle; shared by main() and serve().
+    """
+    if args.replace_output and original_cmd.find("bmxtranswrap") != -1:
+        raise ValueError("replace_output is set but the original cmd contained bmxtranswrap, this is not implemented.")
+    if not args.bmx_cmd_file:
+        return None
+    # Check if original_cmd contains a pipe followed by bmxtranswrap
+    if not re.search(r'\|.*bmxtranswrap', original_cmd):
+        raise ValueError("The original ffastrans command does not use bmxtranswrap, but bmx_cmd_file is set.")
+    bmx_cmd_path = Path(args.bmx_cmd_file)
+    if not bmx_cmd_path.exists():
+        raise ValueError(f"BMX command file not found: {bmx_cmd_path}")
+    return read_cmd_file(bmx_cmd_path).replace("--track-map .+? ", "")
 
 
 def print_diff(original: str, modified: str):
@@ -287,9 +360,58 @@ def ensure_long_path(path_str):
     full_path = os.path.abspath(path_str)
     return r"\\?\\" + full_path
 
-def main():
+def serve(args):
+    """
+    Persistent worker mode: avoids one python startup per job when driven by an orchestrator.
+    Reads one JSON job per line from stdin, keys override the command line options, e.g.
+    {"command_file": "c:\\temp\\enc_cmd.txt", "additional_options": "-preset p4 -g 50"}
+    or with the command inline: {"cmd_string": "ffmpeg -i ...", ...}
+    Writes one JSON line per job to stdout: {"status": "ok", "command": "..."} or {"status": "error", "error": "..."}
+    Commands are not executed, main() sends the logs to stderr to keep stdout parseable.
+    """
+    logging.info("Server mode: waiting for jobs on stdin")
+
+    # Transformers are built once per distinct set of options and reused for following jobs
+    transformers = {}
+
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            job = json.loads(line)
+            job_args = argparse.Namespace(**{**vars(args), **job})
+            if job_args.cmd_string is not None:
+                original_cmd = job_args.cmd_string.strip()
+            elif job_args.command_file:
+                original_cmd = read_cmd_file(job_args.command_file)
+            else:
+                raise ValueError("job does not contain command_file or cmd_string")
+            if not original_cmd:
+                raise ValueError(f"Command is empty: {job_args.command_file or 'cmd_string'}")
+            job_args.bmx_cmd = read_bmx_cmd(original_cmd, job_args)
+            options = {k: v for k, v in vars(job_args).items() if k not in ("command_file", "cmd_string")}
+            key = json.dumps(options, sort_keys=True, default=str)
+            transform = transformers.get(key)
+            if transform is None:
+                transform = transformers[key] = make_transformer(job_args)
+            result = {"status": "ok", "command": transform(original_cmd)}
+        except Exception as e:
+            logging.error(f"Error processing job {line}: {e}")
+            result = {"status": "error", "error": str(e)}
+        sys.stdout.write(json.dumps(result) + "\n")
+        sys.stdout.flush()
+
+
+def main(argv=None):
+    """
+    Command line entry point. argv defaults to sys.argv[1:]; passing a list lets callers
+    run the script in-process (e.g. with redirected stdout) instead of spawning python.
+    Ends with sys.exit like the CLI does.
+    """
     parser = argparse.ArgumentParser(description="Apply transformation rules to FFmpeg command and execute it.")
-    parser.add_argument("command_file", help="Path to the command file to read")
+    parser.add_argument("command_file", nargs="?", help="Path to the command file to read (not used with --server or --cmd_string)")
+    parser.add_argument("--cmd_string", help="The FFmpeg command itself, used instead of reading command_file")
     parser.add_argument("--additional_options", help="Additional options to pass (optional, example -preset p4 -g 50)")
     parser.add_argument("--bmx_cmd_file", help="Path to a file containing a full bmx cmd, prepared to read from pipe. In this case, the ffastrans cmd must end with a bmx cmd already")
     parser.add_argument("--replace_output", help="Path to output file, only works when no bmx is used in ffastrans cmd")
@@ -305,6 +427,8 @@ def main():
     parser.add_argument("--move_target", help="Once encoding is done, move the output file to this target location (overwrites existing files)")
     
     parser.add_argument("--test", help="Test mode: print modified command without executing it", action='store_true')
+    parser.add_argument("--quiet", help="Only log warnings and errors, to stderr; with --test the modified command is the only stdout output", action='store_true')
+    parser.add_argument("--server", help="Worker mode: read JSON jobs from stdin (one per line) and print the modified commands as JSON lines, see serve()", action='store_true')
 
     #duration check
     parser.add_argument("--input_file", help="Path to the input media file for duration checking")
@@ -317,8 +441,37 @@ def main():
     parser.add_argument("--storage_account", help="if output_root is set, attpemts to store credentials in windows credentials manager (optional)")
     parser.add_argument("--storage_pass", help="Storage account password for local storage access (optional)")
 
-    args = parser.parse_args()
-    cmd_file_path = Path(args.command_file)
+    # bmx_cmd is not a CLI option, it is filled from --bmx_cmd_file below; default it so apply_rules can rely on it
+    parser.set_defaults(bmx_cmd=None)
+
+    args = parser.parse_args(argv)
+
+    # The log handler is module global, put it back for later in-process calls (--quiet/--server redirect it)
+    stream, level = stdout_handler.stream, stdout_handler.level
+    try:
+        _main(args, parser)
+    finally:
+        stdout_handler.setStream(stream)
+        stdout_handler.setLevel(level)
+
+
+def _main(args, parser):
+    """Body of main() once the arguments are parsed."""
+    if args.quiet or args.server:
+        # Logs go to stderr, stdout carries nothing but the modified command (or the server's JSON lines)
+        stdout_handler.setStream(sys.stderr)
+    if args.quiet:
+        stdout_handler.setLevel(logging.WARNING)
+    logging.info(f"Startup")
+
+    if args.server:
+        serve(args)
+        sys.exit(0)
+
+    if not args.command_file and args.cmd_string is None:
+        parser.error("the following arguments are required: command_file (or --cmd_string)")
+
+    cmd_file_path = Path(args.command_file) if args.command_file else None
     additional_options = args.additional_options
     replace_output = args.replace_output
     
@@ -375,44 +528,39 @@ def main():
             logging.error(f"Error creating output_root folder: {e}")
             sys.exit(1)
     
-    # Print parsed arguments dynamically
-    logging.info("==== PARSED ARGUMENTS ====")
-    for arg_name, arg_value in vars(args).items():
-        if arg_value is not None and arg_value != "":
-            logging.info(f"{arg_name.replace('_', ' ').title()}: {arg_value}")
-    logging.info("===========================\n")
+    # Print parsed arguments dynamically, as a single log record (one write instead of one per argument)
+    lines = ["==== PARSED ARGUMENTS ===="]
+    lines += [f"{arg_name.replace('_', ' ').title()}: {arg_value}"
+              for arg_name, arg_value in vars(args).items()
+              if arg_value is not None and arg_value != ""]
+    lines.append("===========================\n")
+    logging.info("\n".join(lines))
 
 
-    if not cmd_file_path.exists():
-        logging.error(f"Error: File not found: {cmd_file_path}")
-        sys.exit(1)
+    if args.cmd_string is not None:
+        original_cmd = args.cmd_string.strip()
+    else:
+        if not cmd_file_path.exists():
+            logging.error(f"Error: File not found: {cmd_file_path}")
+            sys.exit(1)
 
-    # Read command
-    with cmd_file_path.open('r', encoding='utf-8') as f:
-        original_cmd = f.read().strip()
+        # Read command
+        try:
+            original_cmd = read_cmd_file(cmd_file_path)
+        except ValueError as e:
+            logging.error(f"Error: {e}")
+            sys.exit(1)
     logging.info(f"==== original_cmd contents ====")
     logging.info(original_cmd)
     logging.info("====================\n")
     
-    if (args.replace_output and original_cmd.find("bmxtranswrap") != -1):
-        # Replace output file in original_cmd with replace_output
-        logging.error(f"Error: replace_output is set but the original cmd contained bmxtranswrap, this is not implemented.")
+    # Check the bmx options and read bmx_cmd_file if set
+    try:
+        bmx_cmd = read_bmx_cmd(original_cmd, args)
+    except ValueError as e:
+        logging.error(f"Error: {e}")
         sys.exit(1)
-
-    # Check if bmx_cmd_file is set and read it if exists
-    bmx_cmd = None
-    if args.bmx_cmd_file:
-        has_bmxtranswrap_pipe = bool(re.search(r'\|.*bmxtranswrap', original_cmd))
-        if not has_bmxtranswrap_pipe:
-            logging.error("Error: The original ffastrans command does not use bmxtranswrap, but bmx_cmd_file is set.")
-            sys.exit(1)
-        bmx_cmd_path = Path(args.bmx_cmd_file)
-        if not bmx_cmd_path.exists():
-            logging.error(f"Error: BMX command file not found: {bmx_cmd_path}")
-            sys.exit(1)
-        with bmx_cmd_path.open('r', encoding='utf-8') as f:
-            bmx_cmd = f.read().strip()
-            bmx_cmd = bmx_cmd.replace("--track-map .+? ", "")  # Escape backslashes for safe insertion
+    if bmx_cmd is not None:
         logging.info(f"==== bmx_cmd contents ====")
         logging.info(bmx_cmd)
         logging.info("====================\n")
@@ -421,21 +569,25 @@ def main():
         logging.error("Error: Command file is empty.")
         sys.exit(1)
     
-    # Check if original_cmd contains a pipe followed by bmxtranswrap
-    
 
     # Apply the transformation rules
     # Set bmx_cmd on args so apply_rules can access it
     args.bmx_cmd = bmx_cmd
     modified_cmd = apply_rules(original_cmd, args)
 
-    # Show differences instead of printing full commands
-    print_diff(original_cmd, modified_cmd)
+    # Show differences instead of printing full commands (skip the diff walk when nothing changed or nobody sees it)
+    if modified_cmd == original_cmd:
+        logging.info("(no transformations applied)")
+    elif not args.quiet:
+        print_diff(original_cmd, modified_cmd)
 
     # Test mode: just print the command without executing
     if args.test:
         logging.info("TEST MODE: Command not executed")
-        logging.info(modified_cmd)
+        if args.quiet:
+            print(modified_cmd)
+        else:
+            logging.info(modified_cmd)
         sys.exit(0)
 
     # Execute modified command
@@ -450,7 +602,9 @@ def main():
             shell=True, 
             stderr=subprocess.PIPE, 
             stdin=subprocess.DEVNULL,
-            universal_newlines=True
+            universal_newlines=True,
+            encoding='utf-8',
+            errors='replace'  # ffmpeg progress output may contain invalid utf-8 (e.g. from metadata)
         )
 
         # This iterator will automatically stop when the pipe closes (process ends)
@@ -467,12 +621,12 @@ def main():
         # If replace_output was set, check if the file exists and > 0kb
         if args.replace_output:
             output_path = Path(args.replace_output)
-            if output_path.exists():
+            try:
                 file_size_kb = output_path.stat().st_size / 1024
                 logging.info(f"Output file created: {args.replace_output} ({file_size_kb:.2f} KB)")
                 if file_size_kb == 0:
                     logging.warning("Warning: Output file is empty (0 KB)")
-            else:
+            except FileNotFoundError:
                 logging.warning(f"Warning: Output file not found: {args.replace_output}")
 
         # If duration check is enabled, perform it
@@ -14,39 +14,76 @@ import sys
 import json
 import os
 import argparse
-import subprocess
 import time
 import logging
+import re
 import uuid
 import shutil
+import functools
+import threading
 import requests
-from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import List, Dict, Any, Optional
 
+# Optional: orjson serializes considerably faster, fall back to the stdlib if it is not installed
+try:
+    import orjson
+
+    def json_dumps(obj, indent: bool = False) -> bytes:
+        """Serialize obj to UTF-8 JSON bytes."""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+except ImportError:
+    orjson = None
+
+    def json_dumps(obj, indent: bool = False) -> bytes:
+        """Serialize obj to UTF-8 JSON bytes."""
+        if indent:
+            return json.dumps(obj, indent=2).encode('utf-8')
+        return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
 # Import local modules
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, BASE_DIR)
 import findfiles
 import jobcontroller_ffastrans_api
 
-# Set up logging with per-process log files
-def setup_logging(source_file=None, timestamp=None):
-    """Set up logging with separate file for each process."""
-    pid = os.getpid()
-    
+# Per-thread logging context, worker threads tag their records with the file index they process
+_log_context = threading.local()
+LOG_FORMAT = '%(asctime)s - [PID:%(process)d] - [%(file_tag)s] - %(levelname)s - %(message)s'
+
+
+class FileTagFilter(logging.Filter):
+    """Adds the file tag of the current worker thread to each record."""
+    def filter(self, record):
+        record.file_tag = getattr(_log_context, 'file_tag', 'main')
+        return True
+
+
+class CurrentThreadFilter(logging.Filter):
+    """Passes only records logged by the thread that created the filter."""
+    def __init__(self):
+        super().__init__()
+        self.thread_id = threading.get_ident()
+
+    def filter(self, record):
+        return record.thread == self.thread_id
+
+
+def get_log_dir(timestamp=None):
+    """Get (and create) the log folder of this run."""
     if timestamp is None:
         timestamp = time.strftime("%Y_%m_%d_%H_%M_%S")
     log_dir = f"c:\\temp\\jobcontroller_{timestamp}"
     os.makedirs(log_dir, exist_ok=True)
-    
-    if source_file:
-        # Use source file basename (without extension) in log filename
-        base_name = os.path.splitext(os.path.basename(source_file))[0]
-        log_filename = os.path.join(log_dir, f"{base_name}_PID_{pid}.log")
-    else:
-        # Fallback to script name if no source file provided
-        script_name = os.path.splitext(os.path.basename(__file__))[0]
-        log_filename = os.path.join(log_dir, f"{script_name}_PID_{pid}.log")
+    return log_dir
+
+
+# Set up logging for the controller process
+def setup_logging(timestamp=None):
+    """Set up console and file logging for the controller process."""
+    pid = os.getpid()
+    script_name = os.path.splitext(os.path.basename(__file__))[0]
+    log_filename = os.path.join(get_log_dir(timestamp), f"{script_name}_PID_{pid}.log")
     
     # Clear any existing handlers
     logger = logging.getLogger()
@@ -54,22 +91,39 @@ def setup_logging(source_file=None, timestamp=None):
     logger.handlers.clear()
     
     # Create formatters
-    formatter = logging.Formatter('%(asctime)s - [PID:%(process)d] - %(levelname)s - %(message)s')
+    formatter = logging.Formatter(LOG_FORMAT)
     
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setFormatter(formatter)
+    console_handler.addFilter(FileTagFilter())
     logger.addHandler(console_handler)
     
-    # File handler (per-process)
+    # File handler (whole run)
     file_handler = logging.FileHandler(log_filename)
     file_handler.setFormatter(formatter)
+    file_handler.addFilter(FileTagFilter())
     logger.addHandler(file_handler)
     
     logging.info(f"Logging to file: {log_filename}")
     return log_filename
 
-setup_logging()
+
+def add_file_log_handler(source_file: str, file_index: int, timestamp: str) -> logging.Handler:
+    """Add a log file for one source file, receiving only the records of the calling worker thread."""
+    # Use source file basename (without extension) in log filename
+    base_name = os.path.splitext(os.path.basename(source_file))[0]
+    log_filename = os.path.join(get_log_dir(timestamp), f"{base_name}_{file_index}.log")
+    
+    file_handler = logging.FileHandler(log_filename)
+    file_handler.setFormatter(logging.Formatter(LOG_FORMAT))
+    file_handler.addFilter(FileTagFilter())
+    file_handler.addFilter(CurrentThreadFilter())
+    logging.getLogger().addHandler(file_handler)
+    
+    logging.info(f"Logging to file: {log_filename}")
+    return file_handler
+
 
 # Configuration
 CONFIG = {
@@ -90,6 +144,10 @@ CONFIG = {
     'ffprobe_path': 'ffprobe',
     'http_max_retries': 10,  # Consecutive HTTP failures before giving up
     'http_poll_interval': 1,  # Seconds between status polls
+    'http_poll_cap': 60,  # Max seconds between retries after failed status polls (exponential backoff)
+    'http_poll_jitter': 1.0,  # Random seconds added to retry delays so workers do not retry in lockstep
+    'http_poll_steady_cap': 30,  # Max seconds between polls while a job keeps running
+    'branch_report_jsonl': '',  # Set per run: one line per processed file, merged into report_file at the end
 }
 
 
@@ -119,29 +177,37 @@ def get_script_path(script_name: str) -> str:
     return script_name
 
 
-def find_files(starting_dir: str, report_file: str) -> List[Dict[str, Any]]:
-    """Find media files using findfiles module."""
+def iter_media_files(starting_dir: str):
+    """Yield media file paths using findfiles module, as the directory walk finds them."""
     logging.info(f"Finding files in {starting_dir}")
     
     # Use findfiles module directly
     include_files = ['*.mxf', '*.mov', '*.mp4']
     exclude_files = ['*_offspeed_*']
     
-    file_paths = findfiles.list_files(
+    return findfiles.iter_files(
         starting_dir,
         include_files=include_files,
         exclude_files=exclude_files
     )
-    
-    # Convert to report format (list of dicts with 'original_file' key)
-    files = [{'original_file': fp} for fp in file_paths]
-    
-    # Write report file
-    with open(report_file, 'w', encoding='utf-8') as f:
-        json.dump(files, f, indent=2)
-    
-    logging.info(f"Found {len(files)} files")
-    return files
+
+
+def _write_report(files: List[Dict[str, Any]], report_file: str):
+    """Write the full report file."""
+    try:
+        with open(report_file, 'wb') as f:
+            f.write(json_dumps(files, indent=True))
+        logging.info(f"Report written: {report_file}")
+    except Exception as e:
+        logging.exception(f"Error writing report {report_file}: {e}")
+
+
+def write_report_async(files: List[Dict[str, Any]], report_file: str) -> threading.Thread:
+    """Write the full report file in a background thread so file processing can start right away.
+    Join the returned thread before the report is read again (merge_branch_reports)."""
+    writer = threading.Thread(target=_write_report, args=(files, report_file), daemon=True)
+    writer.start()
+    return writer
 
 
 def get_framerate(source_file: str) -> float:
@@ -150,63 +216,68 @@ def get_framerate(source_file: str) -> float:
     return info['framerate']
 
 
+FRAMERATE_RE = re.compile(r'(\d+)/(\d+)$')
+
+
 def get_media_info(source_file: str) -> dict:
-    """Get framerate and start timecode from video file using ffprobe."""
-    # Get framerate
-    cmd_fps = [
+    """Get framerate and start timecode from video file using a single ffprobe call."""
+    cmd = [
         CONFIG['ffprobe_path'],
         '-v', 'error',
-        '-select_streams', 'v:0',
-        '-show_entries', 'stream=r_frame_rate',
-        '-of', 'default=noprint_wrappers=1:nokey=1',
+        '-show_entries', 'stream=codec_type,r_frame_rate:stream_tags=timecode:format_tags=timecode',
+        '-of', 'json',
         source_file
     ]
     
     # Log the exact command for manual testing
-    cmd_fps_str = ' '.join([f'"{arg}"' if ' ' in arg else arg for arg in cmd_fps])
-    logging.info(f"Executing ffprobe for framerate: {cmd_fps_str}")
+    cmd_str = ' '.join([f'"{arg}"' if ' ' in arg else arg for arg in cmd])
+    logging.info(f"Executing ffprobe for framerate and timecode: {cmd_str}")
     
-    result_fps = subprocess.run(cmd_fps, capture_output=True, text=True)
-    if result_fps.returncode != 0:
-        logging.error(f"ffprobe failed for {source_file}: {result_fps.stderr}")
+    result = jobcontroller_ffastrans_api.run_captured(cmd)
+    if result.returncode != 0:
+        logging.error(f"ffprobe failed for {source_file}: {result.stderr}")
         return {'framerate': 0.0, 'timecode': None}
     
-    # Parse framerate (format: "25/1" or "30000/1001")
-    fps_str = result_fps.stdout.strip()
-    if '/' in fps_str:
-        num, den = fps_str.split('/')
-        framerate = float(num) / float(den)
+    probe = json.loads(result.stdout or '{}')
+    streams = probe.get('streams', [])
+    
+    # Parse framerate of the first video stream (format: "25/1" or "30000/1001")
+    video_streams = [s for s in streams if s.get('codec_type') == 'video']
+    if not video_streams:
+        logging.error(f"ffprobe found no video stream in {source_file}")
+        return {'framerate': 0.0, 'timecode': None}
+    fps_str = video_streams[0].get('r_frame_rate', '0/1')
+    match = FRAMERATE_RE.match(fps_str)
+    if match:
+        num, den = int(match.group(1)), int(match.group(2))
+        framerate = num / den if den else 0.0
     else:
         framerate = float(fps_str)
     
-    # Get start timecode
-    cmd_tc = [
-        CONFIG['ffprobe_path'],
-        '-v', 'error',
-        '-show_entries', 'format_tags=timecode:stream_tags=timecode',
-        '-of', 'default=noprint_wrappers=1:nokey=1',
-        source_file
-    ]
-    
-    # Log the exact command for manual testing
-    cmd_tc_str = ' '.join([f'"{arg}"' if ' ' in arg else arg for arg in cmd_tc])
-    logging.info(f"Executing ffprobe for timecode: {cmd_tc_str}")
-    
-    result_tc = subprocess.run(cmd_tc, capture_output=True, text=True)
-    logging.info(f"Timecode ffprobe stdout: '{result_tc.stdout.strip()}'")
-    logging.info(f"Timecode ffprobe stderr: '{result_tc.stderr.strip()}'")
-    logging.info(f"Timecode ffprobe returncode: {result_tc.returncode}")
-    
+    # Start timecode: first stream carrying one (could be multiple timecodes from different streams), then the container
     timecode = None
-    if result_tc.returncode == 0 and result_tc.stdout.strip():
-        # Get the first non-empty line (could be multiple timecodes from different streams)
-        lines = [line.strip() for line in result_tc.stdout.strip().split('\n') if line.strip()]
-        if lines:
-            timecode = lines[0]
+    for entry in streams + [probe.get('format', {})]:
+        tc = entry.get('tags', {}).get('timecode', '').strip()
+        if tc:
+            timecode = tc
+            break
+    logging.info(f"Timecode from ffprobe: '{timecode}'")
     
     return {'framerate': framerate, 'timecode': timecode}
 
 
+TIMECODE_RE = re.compile(r'(\d+):(\d+):(\d+):(\d+)$')
+
+
+@functools.lru_cache(maxsize=4096)
+def _frame_convert(frames: int, source_fps: float, target_fps: float) -> int:
+    """Convert a frame number within a second from source to target framerate.
+    Cached, files from the same camera repeat the same combinations."""
+    # Calculate the time position within the second
+    frame_time = frames / source_fps
+    return int(frame_time * target_fps)
+
+
 def convert_timecode_framerate(timecode: str, source_fps: float, target_fps: float) -> str:
     """Convert timecode frames portion from source framerate to target framerate.
     
@@ -218,25 +289,20 @@ def convert_timecode_framerate(timecode: str, source_fps: float, target_fps: flo
     Returns:
         Converted timecode string
     """
-    if not timecode or abs(source_fps - target_fps) < 0.1:
+    if not timecode or source_fps == target_fps or abs(source_fps - target_fps) < 0.1:
         return timecode
     
     # Parse timecode
-    parts = timecode.split(':')
-    if len(parts) != 4:
+    match = TIMECODE_RE.match(timecode)
+    if not match:
         logging.warning(f"Invalid timecode format: {timecode}")
         return timecode
     
     try:
-        hours = int(parts[0])
-        minutes = int(parts[1])
-        seconds = int(parts[2])
-        frames = int(parts[3])
+        hours, minutes, seconds, frames = map(int, match.groups())
         
         # Convert frames portion to target framerate
-        # Calculate the time position within the second
-        frame_time = frames / source_fps
-        new_frames = int(frame_time * target_fps)
+        new_frames = _frame_convert(frames, source_fps, target_fps)
         
         # Construct new timecode
         new_timecode = f"{hours:02d}:{minutes:02d}:{seconds:02d}:{new_frames:02d}"
@@ -249,8 +315,8 @@ def convert_timecode_framerate(timecode: str, source_fps: float, target_fps: flo
 
 
 def create_offspeed_copy(source_file: str, original_source_name: str, original_source_path: str, 
-                         my_framerate: float, project_fps: float, report_branch_file: str) -> str:
-    """Create offspeed copy of video file."""
+                         my_framerate: float, project_fps: float, branch: Dict[str, Any]) -> str:
+    """Create offspeed copy of video file and record it as transcoded_file in the branch report entry."""
     logging.info(f"Creating offspeed copy for {source_file} (source fps: {my_framerate}, project fps: {project_fps})")
     
     # Calculate itsscale factor
@@ -271,20 +337,13 @@ def create_offspeed_copy(source_file: str, original_source_name: str, original_s
         '-y'
     ]
     
-    result = subprocess.run(cmd, capture_output=True, text=True)
+    result = jobcontroller_ffastrans_api.run_captured(cmd)
     if result.returncode != 0:
         logging.error(f"ffmpeg offspeed conversion failed: {result.stderr}")
         raise RuntimeError(f"Offspeed conversion failed: {result.stderr}")
     
     # Update branch report with transcoded file
-    with open(report_branch_file, 'r', encoding='utf-8') as f:
-        branch_report = json.load(f)
-    
-    branch_report[0]['transcoded_file'] = offspeed_file
-    
-    with open(report_branch_file, 'w', encoding='utf-8') as f:
-        json.dump(branch_report, f, indent=2)
-    
+    branch['transcoded_file'] = offspeed_file
     logging.info(f"Added transcoded_file to branch report: {offspeed_file}")
     
     return offspeed_file
@@ -297,27 +356,81 @@ def analyze_mxf_colors(source_file: str) -> str:
     )
 
 
-def process_file(file_entry: Dict[str, Any], file_index: int, config: Dict[str, Any]) -> Dict[str, Any]:
-    """Process a single media file through the workflow."""
+def iter_files(root: str):
+    """Yield all file paths below root, using the file type cached by os.scandir instead of extra stat calls."""
+    stack = [root]
+    while stack:
+        current_dir = stack.pop()
+        with os.scandir(current_dir) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                else:
+                    yield entry.path
+
+
+# Copy buffer for moves across volumes, MXF files are usually several GB
+MOVE_COPY_BUFFER_SIZE = 8 * 1024 * 1024
+
+
+def move_file(src: str, dst: str):
+    """Move a file, using a rename on the same volume and a buffered copy across volumes."""
+    same_volume = os.path.splitdrive(src)[0].lower() == os.path.splitdrive(dst)[0].lower()
+    if same_volume:
+        try:
+            os.replace(src, dst)
+            return
+        except OSError as e:
+            # e.g. different mounts below the same drive, fall back to copying
+            logging.debug(f"Rename {src} -> {dst} failed ({e}), copying instead")
+    
+    with open(src, 'rb', buffering=0) as fsrc, open(dst, 'wb', buffering=0) as fdst:
+        shutil.copyfileobj(fsrc, fdst, length=MOVE_COPY_BUFFER_SIZE)
+    shutil.copystat(src, dst)
+    os.unlink(src)
+
+
+# Serializes appends of the worker threads to the shared branch report file
+_BRANCH_REPORT_LOCK = threading.Lock()
+
+
+def append_branch_report(branch_report_jsonl: str, branch: Dict[str, Any]):
+    """Append the branch report entry as one line to the shared JSONL file of this run. Errors propagate."""
+    line = json_dumps(branch) + b'\n'
+    with _BRANCH_REPORT_LOCK:
+        with open(branch_report_jsonl, 'ab') as f:
+            f.write(line)
+    logging.info(f"Appended branch report to: {branch_report_jsonl}")
+
+
+def process_file(file_entry: Dict[str, Any], file_index: int, config: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Process a single media file through the workflow, logging to its own log file.
+    Uses the module CONFIG unless a config is passed."""
+    if config is None:
+        config = CONFIG
     source_file = file_entry.get('original_file')
     
-    # Set up logging for this worker process with source file in log name
-    setup_logging(source_file, config['run_timestamp'])
+    # Tag all records of this worker thread and mirror them into a log file named after the source file
+    _log_context.file_tag = f"file_{file_index}"
+    file_handler = add_file_log_handler(source_file, file_index, config['run_timestamp'])
+    try:
+        return _process_file(file_entry, file_index, config)
+    finally:
+        logging.getLogger().removeHandler(file_handler)
+        file_handler.close()
+        _log_context.file_tag = 'main'
+
+
+def _process_file(file_entry: Dict[str, Any], file_index: int, config: Dict[str, Any]) -> Dict[str, Any]:
+    """Process a single media file through the workflow."""
+    source_file = file_entry.get('original_file')
     
     logging.info(f"Processing file {file_index}: {source_file}")
     
+    # Branch report entry is collected in memory and written once at the end
+    branch = {'original_file': source_file}
+    
     try:
-        # Create branch report file path
-        reports_dir = os.path.join(config['avid_aaf_output_dir'], 'reports')
-        os.makedirs(reports_dir, exist_ok=True)
-        report_branch_file = os.path.join(reports_dir, f"report_{file_index}.json")
-        
-        # Write initial branch report
-        branch_report = [{'original_file': source_file}]
-        with open(report_branch_file, 'w', encoding='utf-8') as f:
-            json.dump(branch_report, f, indent=2)
-        logging.info(f"Created branch report: {report_branch_file}")
-        
         # Check file framerate and timecode
         media_info = get_media_info(source_file)
         my_framerate = media_info['framerate']
@@ -329,13 +442,9 @@ def process_file(file_entry: Dict[str, Any], file_index: int, config: Dict[str,
         converted_timecode = convert_timecode_framerate(source_timecode, my_framerate, config['project_fps'])
         
         # Store timecode in branch report
-        with open(report_branch_file, 'r', encoding='utf-8') as f:
-            branch_report = json.load(f)
-        branch_report[0]['source_timecode'] = source_timecode
-        branch_report[0]['converted_timecode'] = converted_timecode
-        branch_report[0]['source_framerate'] = my_framerate
-        with open(report_branch_file, 'w', encoding='utf-8') as f:
-            json.dump(branch_report, f, indent=2)
+        branch['source_timecode'] = source_timecode
+        branch['converted_timecode'] = converted_timecode
+        branch['source_framerate'] = my_framerate
         
         if abs(my_framerate - config['project_fps']) > 0.1:
             # Need offspeed conversion
@@ -343,7 +452,7 @@ def process_file(file_entry: Dict[str, Any], file_index: int, config: Dict[str,
             original_source_name = os.path.splitext(os.path.basename(source_file))[0]
             source_file = create_offspeed_copy(
                 source_file, original_source_name, original_source_path,
-                my_framerate, config['project_fps'], report_branch_file
+                my_framerate, config['project_fps'], branch
             )
         
         # Create encoding output directory
@@ -362,9 +471,7 @@ def process_file(file_entry: Dict[str, Any], file_index: int, config: Dict[str,
         # List files in encoding output directory
         encoded_files = []
         if os.path.exists(encoding_output_dir):
-            for root, dirs, files in os.walk(encoding_output_dir):
-                for file in files:
-                    encoded_files.append(os.path.join(root, file))
+            encoded_files = list(iter_files(encoding_output_dir))
         
         logging.info(f"Found {len(encoded_files)} encoded files in subfolders of {encoding_output_dir}")
         
@@ -372,8 +479,7 @@ def process_file(file_entry: Dict[str, Any], file_index: int, config: Dict[str,
         moved_files = []
         for encoded_file in encoded_files:
             dest_file = os.path.join(config['avid_mxf_output_dir'], os.path.basename(encoded_file))
-            os.makedirs(config['avid_mxf_output_dir'], exist_ok=True)
-            shutil.move(encoded_file, dest_file)
+            move_file(encoded_file, dest_file)
             moved_files.append(dest_file)
             logging.info(f"Moved {encoded_file} to {dest_file}")
         
@@ -384,25 +490,26 @@ def process_file(file_entry: Dict[str, Any], file_index: int, config: Dict[str,
         
         # Add moved files to branch report
         if moved_files:
-            with open(report_branch_file, 'r', encoding='utf-8') as f:
-                branch_report = json.load(f)
-            
-            branch_report[0]['avid_files'] = moved_files
-            
-            with open(report_branch_file, 'w', encoding='utf-8') as f:
-                json.dump(branch_report, f, indent=2)
-            
+            branch['avid_files'] = moved_files
             logging.info(f"Added {len(moved_files)} avid_files to branch report")
         
-        return {'status': 'success', 'file': source_file, 'encoded_count': len(encoded_files)}
+        result = {'status': 'success', 'file': source_file, 'encoded_count': len(encoded_files)}
         
     except Exception as e:
         logging.exception(f"Error processing file {source_file}: {e}")
-        return {'status': 'error', 'file': source_file, 'error': str(e)}
+        result = {'status': 'error', 'file': source_file, 'error': str(e)}
+    
+    # Write the branch report also when processing failed, merge_branch_reports expects one per file
+    try:
+        append_branch_report(config['branch_report_jsonl'], branch)
+    except Exception as e:
+        logging.exception(f"Error writing branch report {config['branch_report_jsonl']}: {e}")
+        result = {'status': 'error', 'file': source_file, 'error': f"Branch report not written: {e}"}
+    return result
 
 
-def merge_branch_reports(full_report: str, branch_report_dir: str):
-    """Merge all branch reports back into the full report."""
+def merge_branch_reports(full_report: str, branch_report_jsonl: str):
+    """Merge all branch reports (one JSONL file) back into the full report."""
     logging.info("Merging branch reports")
     
     python_exe = get_python_executable(CONFIG['aaf_script_root'])
@@ -411,11 +518,11 @@ def merge_branch_reports(full_report: str, branch_report_dir: str):
     cmd = [
         python_exe,
         merge_script,
-        '--branch_report_dir', branch_report_dir,
+        '--branch_report_jsonl', branch_report_jsonl,
         '--full_report', full_report
     ]
     
-    result = subprocess.run(cmd, capture_output=True, text=True)
+    result = jobcontroller_ffastrans_api.run_captured(cmd)
     if result.returncode != 0:
         logging.error(f"merge_branch_reports.py failed: {result.stderr}")
         raise RuntimeError(f"Report merging failed: {result.stderr}")
@@ -452,7 +559,7 @@ def create_aaf(report_file: str):
     cmd_str = ' '.join([f'"{arg}"' if ' ' in arg else arg for arg in cmd])
     logging.info(f"Executing createaaf.py: {cmd_str}")
     
-    result = subprocess.run(cmd, capture_output=True, text=True)
+    result = jobcontroller_ffastrans_api.run_captured(cmd)
     if result.returncode != 0:
         logging.error(f"createaaf.py failed: {result.stderr}")
         raise RuntimeError(f"AAF creation failed: {result.stderr}")
@@ -479,6 +586,10 @@ def main():
     
     args = parser.parse_args()
     
+    # Configure logging once per run, all log files of this run share the run timestamp folder
+    run_timestamp = time.strftime("%Y_%m_%d_%H_%M_%S")
+    setup_logging(run_timestamp)
+    
     # Update configuration
     CONFIG.update({
         'starting_dir': args.starting_dir,
@@ -498,7 +609,6 @@ def main():
     
     try:
         start_time = time.time()
-        run_timestamp = time.strftime("%Y_%m_%d_%H_%M_%S")
         CONFIG['run_timestamp'] = run_timestamp
         
         # Modify report_file to include timestamp
@@ -509,20 +619,35 @@ def main():
         new_name = f"{name}_{run_timestamp}{ext}"
         CONFIG['report_file'] = os.path.join(report_dir, new_name)
         
-        # Step 1: Find all media files
-        files = find_files(CONFIG['starting_dir'], CONFIG['report_file'])
+        # Create the shared output folders once, workers only create their own encoding folder
+        reports_dir = os.path.join(CONFIG['avid_aaf_output_dir'], 'reports')
+        os.makedirs(reports_dir, exist_ok=True)
+        os.makedirs(CONFIG['avid_mxf_output_dir'], exist_ok=True)
+        os.makedirs(os.path.join(CONFIG['job_work_dir'], 'temp', run_timestamp), exist_ok=True)
         
-        if not files:
-            logging.warning("No files found to process")
-            return
+        # All workers append their branch report to one JSONL file of this run
+        CONFIG['branch_report_jsonl'] = os.path.join(reports_dir, f"branch_reports_{run_timestamp}.jsonl")
         
-        # Step 2: Process files in parallel
+        # Step 1+2: Find media files and process them in parallel while the tree is still being walked
+        # Threads are sufficient, the work is waiting on ffprobe/ffmpeg child processes, HTTP and file moves
+        files = []
         results = []
-        with ProcessPoolExecutor(max_workers=CONFIG['concurrent_file_processes']) as executor:
-            futures = {
-                executor.submit(process_file, file_entry, idx, CONFIG): idx 
-                for idx, file_entry in enumerate(files)
-            }
+        with ThreadPoolExecutor(max_workers=CONFIG['concurrent_file_processes']) as executor:
+            futures = {}
+            for idx, file_path in enumerate(iter_media_files(CONFIG['starting_dir'])):
+                # Report format is a list of dicts with 'original_file' key
+                file_entry = {'original_file': file_path}
+                files.append(file_entry)
+                futures[executor.submit(process_file, file_entry, idx)] = idx
+
+            if not files:
+                # Same outcome as findfiles.list_files: no report is written, the workflow sees a failure
+                print("Did not find any files in subfolders of: " + str(CONFIG['starting_dir']))
+                sys.exit(1)
+            
+            logging.info(f"Found {len(files)} files")
+            files.sort(key=lambda entry: findfiles.natural_key(entry['original_file']))
+            report_writer = write_report_async(files, CONFIG['report_file'])
             
             for future in as_completed(futures):
                 idx = futures[future]
@@ -535,8 +660,8 @@ def main():
                     results.append({'status': 'error', 'file': f'index_{idx}', 'error': str(e)})
         
         # Step 3: Merge branch reports
-        branch_report_dir = os.path.join(CONFIG['avid_aaf_output_dir'], 'reports')
-        merge_branch_reports(CONFIG['report_file'], branch_report_dir)
+        report_writer.join()
+        merge_branch_reports(CONFIG['report_file'], CONFIG['branch_report_jsonl'])
         
         # Step 4: Create AAF
         create_aaf(CONFIG['report_file'])
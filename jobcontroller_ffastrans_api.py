@@ -5,22 +5,62 @@ Handles job submission and monitoring for FFAStrans workflows
 """
 
 import os
+import pathlib
 import time
 import logging
+import random
+import subprocess
+import tempfile
+import threading
 import uuid
 import requests
+from concurrent.futures import ThreadPoolExecutor
 import urllib.parse
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from typing import Dict, Any, Optional
 
 
+# One keep-alive session per process, created on first use (see get_session)
+_SESSION = None
+
+
+def get_session() -> requests.Session:
+    """Return the shared HTTP session, pooling connections to the FFAStrans API."""
+    global _SESSION
+    if _SESSION is None:
+        session = requests.Session()
+        # Retry covers idempotent requests only (GET), job submission POSTs are never repeated automatically
+        retry_strategy = Retry(total=3, backoff_factor=0.5, status_forcelist=[502, 503, 504])
+        adapter = HTTPAdapter(pool_connections=64, pool_maxsize=64, max_retries=retry_strategy)
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        _SESSION = session
+    return _SESSION
+
+
+def run_captured(cmd) -> subprocess.CompletedProcess:
+    """
+    Run a command and capture its output like subprocess.run(capture_output=True, text=True),
+    but spool stdout/stderr to temporary files instead of pipes. Chatty children (ffmpeg progress)
+    can never stall on a full pipe buffer and no reader threads are needed.
+    """
+    with tempfile.TemporaryFile() as out, tempfile.TemporaryFile() as err:
+        result = subprocess.run(cmd, stdout=out, stderr=err, bufsize=-1)
+        out.seek(0)
+        err.seek(0)
+        stdout = out.read().decode('utf-8', errors='replace')
+        stderr = err.read().decode('utf-8', errors='replace')
+    return subprocess.CompletedProcess(result.args, result.returncode, stdout, stderr)
+
+
 def analyze_mxf_colors(source_file: str, aaf_script_root: str, get_python_executable_func, get_script_path_func) -> str:
     """Analyze MXF file for color information."""
     python_exe = get_python_executable_func(aaf_script_root)
     analyze_script = get_script_path_func('analyze_mxf_colors.py')
     
-    import subprocess
     cmd = [python_exe, analyze_script, source_file]
-    result = subprocess.run(cmd, capture_output=True, text=True)
+    result = run_captured(cmd)
     
     if result.returncode != 0:
         logging.warning(f"analyze_mxf_colors.py failed: {result.stderr}")
@@ -41,15 +81,16 @@ def submit_encoding_job(source_file: str, file_index: int, encoding_output_dir:
     # Get BMX colors
     bmx_colors = analyze_mxf_colors_func(source_file)
     
-    # Create import descriptor (URL encoded path)
-    import_path = source_file.replace('\\', '/')
-    if not import_path.startswith('/'):
-        import_path = '/' + import_path
-    import_path = urllib.parse.quote(import_path, safe='/')
-    avid_meta_import_descr = f"file:{import_path}"
+    # Create import descriptor (file URI with encoded path components)
+    source_path = pathlib.PureWindowsPath(source_file)
+    if source_path.is_absolute():
+        avid_meta_import_descr = source_path.as_uri()
+    else:
+        # as_uri() only accepts absolute paths
+        avid_meta_import_descr = "file:" + urllib.parse.quote('/' + source_path.as_posix(), safe='/')
     
     # Generate unique filename GUID
-    avid_filename_guid = str(uuid.uuid4())
+    avid_filename_guid = uuid.uuid4().hex
     
     # Prepare job JSON
     job_data = {
@@ -69,7 +110,7 @@ def submit_encoding_job(source_file: str, file_index: int, encoding_output_dir:
     }
     
     # POST to FFAStrans API
-    response = requests.post(config['ffastrans_api_url'], json=job_data)
+    response = get_session().post(config['ffastrans_api_url'], json=job_data)
     
     if response.status_code != 200:
         logging.error(f"FFAStrans API error: {response.status_code} - {response.text}")
@@ -77,91 +118,233 @@ def submit_encoding_job(source_file: str, file_index: int, encoding_output_dir:
     
     result = response.json()
     job_id = result.get('job_id')
+    if not job_id:
+        logging.error(f"FFAStrans API returned no job_id: {result}")
+        raise RuntimeError(f"Failed to submit job, no job_id in response: {result}")
     
     logging.info(f"Job submitted successfully: {job_id}")
     return job_id
 
 
-def wait_for_job_completion(job_id: str, variable_to_extract: str = 's_output', config: Dict[str, Any] = None) -> Optional[str]:
-    """Wait for FFAStrans job to complete and extract variable."""
-    logging.info(f"Waiting for job {job_id} to complete")
-    
-    api_url = f"{config['ffastrans_api_getjobdetails_url']}?jobid={job_id}"
-    poll_interval = config.get('http_poll_interval', 1)
-    max_retries = config.get('http_max_retries', 10)  # Consecutive HTTP failures before giving up
-    
-    consecutive_failures = 0
-    start_time = time.time()
-    
-    # Initial delay to allow job to be indexed in the system
-    time.sleep(2)
-    
-    while True:
-        elapsed = time.time() - start_time
+# Number of polls with unchanged job status after which the steady poll interval grows
+STEADY_POLL_GROWTH_EVERY = 10
+STEADY_POLL_GROWTH_FACTOR = 1.5
+
+# How often a waiting worker checks that the poller thread is still alive
+POLLER_ALIVE_CHECK_INTERVAL = 30
+
+
+def _failure_delay(poll_interval: float, consecutive_failures: int, cap: float, jitter: float) -> float:
+    """Truncated exponential backoff with jitter for failed status requests."""
+    return min(cap, poll_interval * (2 ** consecutive_failures)) + random.uniform(0, jitter)
+
+
+class _JobWatch:
+    """Polling state of one job, see JobPoller."""
+
+    def __init__(self, job_id: str, poll_interval: float):
+        self.job_id = job_id
+        self.done = threading.Event()
+        self.details = None  # Final job details, stays None if polling gave up
+        self.consecutive_failures = 0
+        self.steady_interval = poll_interval
+        self.unchanged_polls = 0
+        self.last_status = None
+        self.polling = False  # A status request for this job is in flight
+        self.start_time = time.time()
+        # Initial delay to allow job to be indexed in the system
+        self.next_poll = time.monotonic() + 2
+
+
+class JobPoller:
+    """
+    Polls the status of all outstanding FFAStrans jobs from one background thread
+    instead of one poll loop per worker. Each job keeps its own schedule
+    (adaptive interval while running, exponential backoff with jitter on failures),
+    requests reuse the keep-alive session. Jobs that are due at the same time are
+    polled concurrently, so one slow or timing out request does not delay the others.
+    """
+
+    def __init__(self, config: Dict[str, Any]):
+        self.api_url = config['ffastrans_api_getjobdetails_url']
+        self.poll_interval = config.get('http_poll_interval', 1)
+        self.max_retries = config.get('http_max_retries', 10)  # Consecutive HTTP failures before giving up
+        self.poll_cap = config.get('http_poll_cap', 60)  # Max sleep between retries of failed requests
+        self.poll_jitter = config.get('http_poll_jitter', 1.0)
+        self.steady_cap = config.get('http_poll_steady_cap', 30)  # Max sleep between polls of a running job
+        self._watches = []  # _JobWatch objects, job_ids are not guaranteed to be unique
+        self._executor = ThreadPoolExecutor(max_workers=config.get('http_poll_concurrency', 8), thread_name_prefix="JobPoll")
+        self._lock = threading.Lock()
+        self._wakeup = threading.Event()
+        self._thread = None
+
+    def wait(self, job_id: str) -> Optional[Dict[str, Any]]:
+        """Block until the job reached a final status. Returns its job details, None if polling gave up."""
+        watch = _JobWatch(job_id, self.poll_interval)
+        with self._lock:
+            self._watches.append(watch)
+            if self._thread is None or not self._thread.is_alive():
+                self._thread = threading.Thread(target=self._run, name="JobPoller", daemon=True)
+                self._thread.start()
+        self._wakeup.set()
+        # Never block forever: if the poller thread is gone, nobody is going to finish this watch
+        while not watch.done.wait(POLLER_ALIVE_CHECK_INTERVAL):
+            with self._lock:
+                if self._thread is not None and self._thread.is_alive():
+                    continue
+                if watch in self._watches:
+                    self._watches.remove(watch)
+            if not watch.done.is_set():
+                logging.error(f"Job poller thread is not running, giving up on job {job_id}")
+                return None
+        return watch.details
+
+    def _run(self):
+        try:
+            self._poll_loop()
+        except Exception as e:
+            logging.exception(f"Job poller failed: {e}")
+            # Release every waiting worker, their jobs count as given up
+            with self._lock:
+                watches, self._watches = self._watches, []
+                self._thread = None
+            for watch in watches:
+                watch.done.set()
+
+    def _poll_loop(self):
+        while True:
+            with self._lock:
+                watches = list(self._watches)
+                if not watches:
+                    # Next wait() starts a new thread
+                    self._thread = None
+                    return
+            
+            # Requests run on the executor, this loop only schedules; _polled wakes it up again
+            now = time.monotonic()
+            for watch in watches:
+                if not watch.polling and watch.next_poll <= now:
+                    watch.polling = True
+                    future = self._executor.submit(self._poll, watch)
+                    future.add_done_callback(lambda f, watch=watch: self._polled(watch, f))
+            
+            # Sleep until the next job is due, a request completed or a new job is registered
+            self._wakeup.clear()
+            with self._lock:
+                next_poll = min((w.next_poll for w in self._watches if not w.polling), default=None)
+            self._wakeup.wait(None if next_poll is None else max(0, next_poll - time.monotonic()))
+
+    def _polled(self, watch: _JobWatch, future):
+        try:
+            finished = future.result()
+        except Exception as e:
+            logging.exception(f"Error polling job {watch.job_id}: {e}")
+            finished = self._failed(watch)
+        watch.polling = False
+        if finished:
+            with self._lock:
+                self._watches.remove(watch)
+            watch.done.set()
+        self._wakeup.set()
+
+    def _failed(self, watch: _JobWatch) -> bool:
+        """Count a failed request, returns True when giving up on the job."""
+        watch.consecutive_failures += 1
+        if watch.consecutive_failures >= self.max_retries:
+            logging.error(f"Max consecutive HTTP failures ({self.max_retries}) exceeded for job {watch.job_id}")
+            return True
+        watch.next_poll = time.monotonic() + _failure_delay(self.poll_interval, watch.consecutive_failures, self.poll_cap, self.poll_jitter)
+        return False
+
+    def _poll(self, watch: _JobWatch) -> bool:
+        """Poll one job once, returns True when the job reached a final status or polling gave up."""
+        job_id = watch.job_id
+        api_url = f"{self.api_url}?jobid={job_id}"
+        elapsed = time.time() - watch.start_time
         
         try:
-            response = requests.get(api_url, timeout=10)
+            response = get_session().get(api_url, timeout=10)
             
             if response.status_code != 200:
-                consecutive_failures += 1
-                logging.warning(f"Failed to get job details (attempt {consecutive_failures}/{max_retries}): {response.status_code}, URL: {api_url}")
+                logging.warning(f"Failed to get job details (attempt {watch.consecutive_failures + 1}/{self.max_retries}): {response.status_code}, URL: {api_url}")
                 logging.warning(f"Response body: {response.text}")
-                
-                if consecutive_failures >= max_retries:
-                    logging.error(f"Max consecutive HTTP failures ({max_retries}) exceeded for job {job_id}")
-                    return None
-                
-                time.sleep(poll_interval)
-                continue
+                return self._failed(watch)
             
             # Reset consecutive failure counter on successful HTTP request
-            consecutive_failures = 0
+            watch.consecutive_failures = 0
             
             job_details = response.json()
             status = job_details.get('status')
             
-            if status == 'finished':
-                logging.info(f"Job {job_id} completed successfully (elapsed: {elapsed:.1f}s)")
-                
-                # Extract variable from workflow object
-                wf_object = job_details.get('wf_object', {})
-                nodes = wf_object.get('nodes', [])
-                
-                for node in nodes:
-                    properties = node.get('properties', {})
-                    variables = properties.get('variables', [])
-                    
-                    for var in variables:
-                        if var.get('name') == variable_to_extract:
-                            return var.get('data')
-                
-                logging.warning(f"Variable {variable_to_extract} not found in job output")
-                return None
-            
-            elif status in ['error', 'failed']:
-                logging.error(f"Job {job_id} failed with status: {status}")
-                return None
+            if status in ['finished', 'error', 'failed']:
+                watch.details = job_details
+                return True
             
-            # Job still running
-            logging.debug(f"Job {job_id} status: {status} (elapsed: {elapsed:.1f}s)")
-            time.sleep(poll_interval)
+            # Job still running, poll less often the longer the status stays unchanged
+            if status != watch.last_status:
+                watch.last_status = status
+                watch.steady_interval = self.poll_interval
+                watch.unchanged_polls = 0
+            watch.unchanged_polls += 1
+            if watch.unchanged_polls % STEADY_POLL_GROWTH_EVERY == 0:
+                watch.steady_interval = min(self.steady_cap, watch.steady_interval * STEADY_POLL_GROWTH_FACTOR)
+            logging.debug(f"Job {job_id} status: {status} (elapsed: {elapsed:.1f}s, next poll in {watch.steady_interval:.1f}s)")
+            watch.next_poll = time.monotonic() + watch.steady_interval
+            return False
             
         except requests.exceptions.Timeout:
-            consecutive_failures += 1
-            logging.warning(f"HTTP timeout checking job status (attempt {consecutive_failures}/{max_retries}), URL: {api_url}")
-            
-            if consecutive_failures >= max_retries:
-                logging.error(f"Max consecutive HTTP failures ({max_retries}) exceeded for job {job_id}")
-                return None
-            
-            time.sleep(poll_interval)
+            logging.warning(f"HTTP timeout checking job status (attempt {watch.consecutive_failures + 1}/{self.max_retries}), URL: {api_url}")
+            return self._failed(watch)
             
         except Exception as e:
-            consecutive_failures += 1
-            logging.exception(f"Error checking job status (attempt {consecutive_failures}/{max_retries}) for {job_id}, URL: {api_url}: {e}")
-            
-            if consecutive_failures >= max_retries:
-                logging.error(f"Max consecutive failures ({max_retries}) exceeded for job {job_id}")
-                return None
-            
-            time.sleep(poll_interval)
+            logging.exception(f"Error checking job status (attempt {watch.consecutive_failures + 1}/{self.max_retries}) for {job_id}, URL: {api_url}: {e}")
+            return self._failed(watch)
+
+
+# One poller per process, created on first use (see get_poller)
+_POLLER = None
+_POLLER_LOCK = threading.Lock()
+
+# Distinguishes a variable missing from the job output from one whose data is None
+_MISSING = object()
+
+
+def get_poller(config: Dict[str, Any]) -> JobPoller:
+    """Return the shared job poller."""
+    global _POLLER
+    with _POLLER_LOCK:
+        if _POLLER is None:
+            _POLLER = JobPoller(config)
+        return _POLLER
+
+
+def wait_for_job_completion(job_id: str, variable_to_extract: str = 's_output', config: Dict[str, Any] = None) -> Optional[str]:
+    """Wait for FFAStrans job to complete and extract variable."""
+    logging.info(f"Waiting for job {job_id} to complete")
+    start_time = time.time()
+    
+    job_details = get_poller(config).wait(job_id)
+    elapsed = time.time() - start_time
+    if job_details is None:
+        logging.error(f"Gave up waiting for job {job_id} (elapsed: {elapsed:.1f}s)")
+        return None
+    
+    status = job_details.get('status')
+    if status != 'finished':
+        logging.error(f"Job {job_id} failed with status: {status}")
+        return None
+    
+    logging.info(f"Job {job_id} completed successfully (elapsed: {elapsed:.1f}s)")
+    
+    # Index the variables of all nodes once, the first node defining a name wins
+    wf_object = job_details.get('wf_object', {})
+    vars_by_name = {}
+    for node in wf_object.get('nodes', []):
+        for var in node.get('properties', {}).get('variables', []):
+            vars_by_name.setdefault(var.get('name'), var.get('data'))
+    
+    value = vars_by_name.get(variable_to_extract, _MISSING)
+    if value is _MISSING:
+        logging.warning(f"Variable {variable_to_extract} not found in job output")
+        return None
+    return value
@@ -17,6 +17,7 @@ Input parameters:
 - poll_frequency: Optional, default 60 seconds
 - disable_polling: Optional, skip job monitoring after launch
 - json_escape_input_file: Optional, double-escape input file before JSON submission
+- result_cache: Optional, JSON file of successful results, inputs found there are not launched again
 
 Flow:
 1. Call webui_url/tickets and filter for variables_from_job_id
@@ -28,13 +29,18 @@ Flow:
 """
 
 import argparse
+import hashlib
 import json
 import logging
+import os
 import sys
+import threading
 import time
+from email.utils import parsedate_to_datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta, timezone
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Any
+from typing import Callable, Dict, List, Optional, Tuple, Any
 
 import requests
 from requests.adapters import HTTPAdapter
@@ -74,20 +80,57 @@ def _parse_datetime(date_string: Optional[str]) -> datetime:
         return datetime.now(timezone.utc)
 
 
+# Cap for the sleep between urllib3 retries of one request
+RETRY_BACKOFF_MAX = 30
+
+
+class _CappedRetry(Retry):
+    """urllib3 1.26 has no backoff_max argument, the cap is a class attribute there
+    (BACKOFF_MAX, renamed DEFAULT_BACKOFF_MAX in 1.26.9)."""
+    BACKOFF_MAX = DEFAULT_BACKOFF_MAX = RETRY_BACKOFF_MAX
+
+
+def create_retry(**kwargs) -> Retry:
+    """Retry with the backoff capped at RETRY_BACKOFF_MAX on urllib3 2.x and 1.26."""
+    try:
+        return Retry(backoff_max=RETRY_BACKOFF_MAX, **kwargs)
+    except TypeError:
+        return _CappedRetry(**kwargs)
+
+
 def create_session_with_retries(
     retries: int = 3,
     backoff_factor: float = 0.5,
-    status_forcelist: Tuple = (500, 502, 503, 504)
+    status_forcelist: Tuple = (500, 502, 503, 504),
+    pool_size: int = 64,
+    raise_on_status: bool = True
 ) -> requests.Session:
-    """Create a requests session with retry strategy."""
+    """
+    Create a requests session with retry strategy.
+    pool_size keep-alive connections per host are kept, it must be at least the
+    number of threads sharing the session (see monitor_jobs result fetches).
+    With raise_on_status=False an exhausted status retry budget returns the last
+    response (headers included) instead of raising RetryError.
+    """
     session = requests.Session()
-    retry_strategy = Retry(
+    # Retry-After is not honored here, urllib3 would sleep for whatever the server asks
+    # inside a single request. Sleeps stay bounded by backoff_max and an exhausted
+    # budget surfaces as RetryError (or the last response, see raise_on_status),
+    # so the callers' own poll loops stay in control.
+    retry_strategy = create_retry(
         total=retries,
         backoff_factor=backoff_factor,
         status_forcelist=status_forcelist,
-        allowed_methods=['GET', 'POST']
+        allowed_methods=['GET', 'POST'],
+        respect_retry_after_header=False,
+        raise_on_status=raise_on_status
+    )
+    adapter = HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        pool_block=False,
+        max_retries=retry_strategy
     )
-    adapter = HTTPAdapter(max_retries=retry_strategy)
     session.mount('http://', adapter)
     session.mount('https://', adapter)
     return session
@@ -102,31 +145,62 @@ def load_input_file(input_file: str, logger: logging.Logger) -> List[str]:
     try:
         file_path = Path(input_file)
         if not file_path.exists():
-            logger.error(f'Input file not found: {input_file}')
+            logger.error('Input file not found: %s', input_file)
             return []
 
-        with open(file_path, 'r') as f:
-            content = f.read().strip()
-
-        if content.startswith('['):
-            data = json.loads(content)
-            if isinstance(data, list):
-                logger.info(f'Loaded {len(data)} files from JSON array')
-                return data
-            else:
-                logger.error('JSON file does not contain an array')
-                return []
+        # Sniff the first non-whitespace byte, a single media path is never read beyond that
+        with open(file_path, 'rb') as f:
+            first = f.read(1)
+            while first and first.isspace():
+                first = f.read(1)
+            if first != b'[':
+                return [input_file]
+            f.seek(0)
+            data = json.loads(f.read())
+
+        if isinstance(data, list):
+            logger.info('Loaded %s files from JSON array', len(data))
+            return data
         else:
-            return [input_file]
+            logger.error('JSON file does not contain an array')
+            return []
 
     except json.JSONDecodeError as e:
-        logger.error(f'Failed to parse JSON from input file: {e}')
+        logger.error('Failed to parse JSON from input file: %s', e)
         return []
     except Exception as e:
-        logger.error(f'Error reading input file: {e}')
+        logger.error('Error reading input file: %s', e)
         return []
 
 
+# Full /tickets responses by webui_url: (fetch time, parsed json)
+_TICKETS_CACHE: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+TICKETS_CACHE_TTL = 10  # seconds
+
+
+def _get_tickets_cached(
+    webui_url: str,
+    session: requests.Session,
+    logger: logging.Logger,
+    ttl: float = TICKETS_CACHE_TTL
+) -> Dict[str, Any]:
+    """GET webui_url/tickets, reusing a response younger than ttl seconds (ttl=0 forces a fetch)."""
+    cached = _TICKETS_CACHE.get(webui_url)
+    if cached and time.monotonic() - cached[0] < ttl:
+        logger.debug('Using cached tickets of %s', webui_url)
+        return cached[1]
+
+    tickets_url = f'{webui_url}/tickets'
+    logger.info('Fetching tickets from %s', tickets_url)
+
+    response = session.get(tickets_url, timeout=10)
+    response.raise_for_status()
+
+    tickets = response.json()
+    _TICKETS_CACHE[webui_url] = (time.monotonic(), tickets)
+    return tickets
+
+
 def fetch_variables_from_job(
     webui_url: str,
     job_id: str,
@@ -134,44 +208,45 @@ def fetch_variables_from_job(
     logger: logging.Logger
 ) -> Optional[List[Dict[str, str]]]:
     """Fetch variables from a running job via tickets endpoint. Retry for 60 seconds if not found."""
-    tickets_url = f'{webui_url}/tickets'
     start_time = time.time()
     retry_timeout = 10  # 10 seconds
+    ttl = TICKETS_CACHE_TTL
     
     while (time.time() - start_time) < retry_timeout:
         try:
-            logger.info(f'Fetching tickets from {tickets_url}')
-
-            response = session.get(tickets_url, timeout=10)
-            response.raise_for_status()
-
-            tickets = response.json()
-            logger.debug(f'Tickets response: {tickets}')
+            tickets = _get_tickets_cached(webui_url, session, logger, ttl)
+            # Job was not in the tickets used so far, only fresh ones can change that
+            ttl = 0
+            logger.debug('Tickets response: %s', tickets)
             running_jobs = tickets.get('tickets', {}).get('running', [])
 
             for job in running_jobs:
                 if job.get('job_id') == job_id:
                     variables = job.get('variables', [])
                     logger.info(
-                        f'Found {len(variables)} variables from job {job_id}'
+                        'Found %s variables from job %s',
+                        len(variables), job_id
                     )
                     return variables
 
             elapsed = int(time.time() - start_time)
-            logger.info(f'Job {job_id} not found in running jobs, retrying... ({elapsed}s elapsed)')
+            logger.info('Job %s not found in running jobs, retrying... (%ds elapsed)', job_id, elapsed)
             time.sleep(2)
 
+        except requests.exceptions.RetryError as e:
+            logger.warning('Retries exhausted fetching tickets, server kept answering with an error status: %s, retrying...', e)
+            time.sleep(2)
         except requests.exceptions.RequestException as e:
-            logger.warning(f'HTTP error fetching tickets: {e}, retrying...')
+            logger.warning('HTTP error fetching tickets: %s, retrying...', e)
             time.sleep(2)
         except json.JSONDecodeError as e:
-            logger.warning(f'Invalid JSON in tickets response: {e}, retrying...')
+            logger.warning('Invalid JSON in tickets response: %s, retrying...', e)
             time.sleep(2)
         except Exception as e:
-            logger.warning(f'Unexpected error fetching variables from job: {e}, retrying...')
+            logger.warning('Unexpected error fetching variables from job: %s, retrying...', e)
             time.sleep(2)
     
-    logger.error(f'Job {job_id} not found in running jobs after {retry_timeout} seconds')
+    logger.error('Job %s not found in running jobs after %s seconds', job_id, retry_timeout)
     raise Exception(f'Failed to fetch variables from job {job_id}')
 
 
@@ -193,11 +268,11 @@ def prepare_variables(
             logger
         )
         prepared_vars.extend(fetched_vars)
-        logger.info(f'Added {len(fetched_vars)} variables from job')
+        logger.info('Added %s variables from job', len(fetched_vars))
 
     for name, data in variables_list:
         prepared_vars.append({'name': name, 'data': data})
-        logger.debug(f'Added variable: {name}')
+        logger.debug('Added variable: %s', name)
 
     return prepared_vars
 
@@ -207,6 +282,10 @@ def _json_escape_string(value: str) -> str:
     return json.dumps(value)
 
 
+# Number of job POSTs in flight at once, keeps the rate towards the WebUI bounded
+LAUNCH_CONCURRENCY = 4
+
+
 def launch_jobs(
     wf_id: str,
     input_files: List[str],
@@ -222,8 +301,8 @@ def launch_jobs(
     """
     Launch jobs and return list of (job_id, launch_time, input_file) tuples.
     If batch_submit is True, submit all jobs in a single request as an array.
+    Otherwise up to LAUNCH_CONCURRENCY jobs are posted concurrently, results keep the input order.
     """
-    launched_jobs = []
     jobs_url = f'{webui_url}/jobs'
 
     if batch_submit:
@@ -232,53 +311,78 @@ def launch_jobs(
             jobs_url, json_escape_input_file, session, logger
         )
 
-    for idx, input_file in enumerate(input_files):
-        try:
-            job_input_file = (
-                _json_escape_string(input_file)
-                if json_escape_input_file
-                else input_file
-            )
-            job_data = {
-                'wf_id': wf_id,
-                'inputfile': job_input_file,
-                'start_proc': start_proc,
-                'priority': priority,
-                'variables': variables
-            }
+    def launch(idx_and_file):
+        idx, input_file = idx_and_file
+        return _launch_job(
+            idx, len(input_files), input_file, wf_id, start_proc, priority, variables,
+            jobs_url, json_escape_input_file, session, logger
+        )
 
-            logger.info(
-                f'Launching job {idx + 1}/{len(input_files)}: {input_file}'
-            )
+    with ThreadPoolExecutor(max_workers=LAUNCH_CONCURRENCY) as executor:
+        launched = executor.map(launch, enumerate(input_files))
+        return [job for job in launched if job is not None]
 
-            logger.info("POST Job data: %s", job_data)
-            response = session.post(
-                jobs_url,
-                json=job_data,
-                timeout=10
-            )
-            response.raise_for_status()
 
-            result = response.json()
-            job_id = result.get('job_id')
+def _launch_job(
+    idx: int,
+    total: int,
+    input_file: str,
+    wf_id: str,
+    start_proc: str,
+    priority: str,
+    variables: List[Dict[str, str]],
+    jobs_url: str,
+    json_escape_input_file: bool,
+    session: requests.Session,
+    logger: logging.Logger
+) -> Optional[Tuple[str, datetime, str]]:
+    """Launch a single job, return (job_id, launch_time, input_file) or None if it failed."""
+    try:
+        job_input_file = (
+            _json_escape_string(input_file)
+            if json_escape_input_file
+            else input_file
+        )
+        job_data = {
+            'wf_id': wf_id,
+            'inputfile': job_input_file,
+            'start_proc': start_proc,
+            'priority': priority,
+            'variables': variables
+        }
 
-            if job_id:
-                launched_jobs.append((job_id, datetime.now(timezone.utc), input_file))
-                logger.info(f'Job launched successfully: {job_id}')
-            else:
-                logger.error(f'No job_id in response for {input_file}')
+        logger.info(
+            'Launching job %s/%s: %s',
+            idx + 1, total, input_file
+        )
 
-            if idx < len(input_files) - 1:
-                time.sleep(0.5)
+        logger.info("POST Job data: %s", job_data)
+        response = session.post(
+            jobs_url,
+            json=job_data,
+            timeout=10
+        )
+        response.raise_for_status()
 
-        except requests.exceptions.RequestException as e:
-            logger.error(f'HTTP error launching job {idx + 1}: {e}')
-        except json.JSONDecodeError as e:
-            logger.error(f'Invalid JSON in job response {idx + 1}: {e}')
-        except Exception as e:
-            logger.error(f'Unexpected error launching job {idx + 1}: {e}')
+        result = response.json()
+        job_id = result.get('job_id')
 
-    return launched_jobs
+        if job_id:
+            logger.info('Job launched successfully: %s', job_id)
+            return (job_id, datetime.now(timezone.utc), input_file)
+
+        logger.error('No job_id in response for %s', input_file)
+
+    except requests.exceptions.RetryError as e:
+        logger.error('Retries exhausted launching job %s, server kept answering with an error status: %s', idx + 1, e)
+    except requests.exceptions.RequestException as e:
+        logger.error('HTTP error launching job %s: %s', idx + 1, e)
+    except json.JSONDecodeError as e:
+        logger.error('Invalid JSON in job response %s: %s', idx + 1, e)
+    except Exception as e:
+        logger.error('Unexpected error launching job %s: %s', idx + 1, e)
+
+    return None
 
 
 def _launch_jobs_batch(
@@ -313,7 +417,7 @@ def _launch_jobs_batch(
             'variables': variables
         })
 
-    logger.info(f'Batch submitting {len(jobs_array)} jobs in single request')
+    logger.info('Batch submitting %s jobs in single request', len(jobs_array))
     logger.info("POST Jobs array: %s", jobs_array)
 
     try:
@@ -334,9 +438,9 @@ def _launch_jobs_batch(
                 input_file = input_files[idx] if idx < len(input_files) else 'Unknown'
                 if job_id:
                     launched_jobs.append((job_id, launch_time, input_file))
-                    logger.info(f'Job {idx + 1} launched successfully: {job_id}')
+                    logger.info('Job %s launched successfully: %s', idx + 1, job_id)
                 else:
-                    logger.error(f'No job_id in response for job {idx + 1}: {input_file}')
+                    logger.error('No job_id in response for job %s: %s', idx + 1, input_file)
         # Handle single response with job_ids array
         elif isinstance(result, dict):
             job_ids = result.get('job_ids', [])
@@ -344,23 +448,25 @@ def _launch_jobs_batch(
                 for idx, job_id in enumerate(job_ids):
                     input_file = input_files[idx] if idx < len(input_files) else 'Unknown'
                     launched_jobs.append((job_id, launch_time, input_file))
-                    logger.info(f'Job {idx + 1} launched successfully: {job_id}')
+                    logger.info('Job %s launched successfully: %s', idx + 1, job_id)
             # Fallback: single job_id in response
             elif result.get('job_id'):
                 job_id = result.get('job_id')
                 launched_jobs.append((job_id, launch_time, input_files[0]))
-                logger.info(f'Job launched successfully: {job_id}')
+                logger.info('Job launched successfully: %s', job_id)
             else:
                 logger.error('No job_id(s) found in batch response')
         else:
-            logger.error(f'Unexpected response format: {type(result)}')
+            logger.error('Unexpected response format: %s', type(result))
 
+    except requests.exceptions.RetryError as e:
+        logger.error('Retries exhausted during batch job submission, server kept answering with an error status: %s', e)
     except requests.exceptions.RequestException as e:
-        logger.error(f'HTTP error during batch job submission: {e}')
+        logger.error('HTTP error during batch job submission: %s', e)
     except json.JSONDecodeError as e:
-        logger.error(f'Invalid JSON in batch job response: {e}')
+        logger.error('Invalid JSON in batch job response: %s', e)
     except Exception as e:
-        logger.error(f'Unexpected error during batch job submission: {e}')
+        logger.error('Unexpected error during batch job submission: %s', e)
 
     return launched_jobs
 
@@ -374,54 +480,196 @@ def _job_id_in_tickets(job_id: str, ticket_list: List[str]) -> bool:
     return False
 
 
+def job_cache_key(wf_id: str, input_file: str, variables: List[Dict[str, str]]) -> str:
+    """Identify a logical job (same workflow, input and variables) across launcher runs."""
+    key_data = json.dumps([wf_id, input_file, variables], sort_keys=True)
+    return hashlib.sha256(key_data.encode('utf-8')).hexdigest()
+
+
+class ResultCache:
+    """
+    Final results of successful jobs, persisted as a JSON file keyed by job_cache_key().
+    Every put() is written through to disk, so results survive a launcher restart.
+    """
+
+    def __init__(self, path: str, logger: logging.Logger):
+        self.path = path
+        self.logger = logger
+        self._lock = threading.Lock()
+        self._results = {}
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                self._results = json.load(f)
+            logger.info('Loaded %s cached job results from %s', len(self._results), path)
+        except FileNotFoundError:
+            pass
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning('Ignoring unreadable result cache %s: %s', path, e)
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """Return the cached result with datetimes restored, or None."""
+        cached = self._results.get(key)
+        if cached is None:
+            return None
+        return dict(
+            cached,
+            launch_time=_parse_datetime(cached.get('launch_time')),
+            completion_time=_parse_datetime(cached.get('completion_time'))
+        )
+
+    def put(self, key: str, result: Dict[str, Any]) -> None:
+        """Store a result and write the cache file (temp file plus replace, never half written)."""
+        entry = dict(
+            result,
+            launch_time=result['launch_time'].isoformat(),
+            completion_time=result['completion_time'].isoformat()
+        )
+        with self._lock:
+            self._results[key] = entry
+            try:
+                cache_dir = os.path.dirname(self.path)
+                if cache_dir:
+                    os.makedirs(cache_dir, exist_ok=True)
+                tmp_path = self.path + '.tmp'
+                with open(tmp_path, 'w', encoding='utf-8') as f:
+                    json.dump(self._results, f)
+                os.replace(tmp_path, self.path)
+            except OSError as e:
+                self.logger.warning('Could not write result cache %s: %s', self.path, e)
+
+
 def fetch_job_result(
-    webui_url: str,
+    jobs_url: str,
     job_id: str,
     session: requests.Session,
     logger: logging.Logger,
     retry_count: int = 10,
     retry_delay: int = 5
 ) -> Optional[Dict[str, Any]]:
-    """Fetch final job result from /jobs?jobid=... with retries."""
-    jobs_url = f'{webui_url}/jobs?jobid={job_id}'
+    """Fetch final job result from /jobs?jobid=... with retries. jobs_url is webui_url/jobs."""
+    params = {'jobid': job_id}
 
     for attempt in range(retry_count):
         try:
-            response = session.get(jobs_url, timeout=10)
+            response = session.get(jobs_url, params=params, timeout=10)
             response.raise_for_status()
             result = response.json()
 
+            # The WebUI filters by jobid, so history is normally just this job; should it return
+            # more, index the finished entries once (first one per job_id wins)
+            finished = {}
             for job_entry in result.get('history', []):
-                if job_entry.get('job_id') == job_id:
-                    state = job_entry.get('state')
-                    if state is not None:
-                        return job_entry
+                if job_entry.get('state') is not None:
+                    finished.setdefault(job_entry.get('job_id'), job_entry)
+
+            job_entry = finished.get(job_id)
+            if job_entry is not None:
+                return job_entry
 
             logger.debug(
-                f'Job {job_id} not yet in history, '
-                f'retry {attempt + 1}/{retry_count}'
+                'Job %s not yet in history, retry %s/%s',
+                job_id, attempt + 1, retry_count
             )
         except Exception as e:
             logger.warning(
-                f'Error fetching result for {job_id}: {e}, '
-                f'retry {attempt + 1}/{retry_count}'
+                'Error fetching result for %s: %s, retry %s/%s',
+                job_id, e, attempt + 1, retry_count
             )
 
         time.sleep(retry_delay)
 
-    logger.error(f'Could not fetch result for job {job_id} after {retry_count} retries')
+    logger.error('Could not fetch result for job %s after %s retries', job_id, retry_count)
     return None
 
 
+def _retry_after_seconds(response: Optional[requests.Response]) -> Optional[float]:
+    """Return the Retry-After of a response in seconds (delta-seconds or HTTP-date), if any."""
+    if response is None:
+        return None
+    value = response.headers.get('Retry-After')
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+    except (TypeError, ValueError):
+        return None
+
+
+def _is_server_overload(error: Exception) -> bool:
+    """True for errors where the WebUI answered but signals load (5xx or 429, retried or not)."""
+    if isinstance(error, requests.exceptions.RetryError):
+        return True
+    response = getattr(error, 'response', None)
+    return response is not None and (response.status_code >= 500 or response.status_code == 429)
+
+
+def _collect_job_result(
+    jobs_url: str,
+    job_id: str,
+    launch_time: datetime,
+    input_file: str,
+    ticket_times: Optional[Dict[str, float]],
+    session: requests.Session,
+    logger: logging.Logger
+) -> Dict[str, Any]:
+    """Fetch the final result of a job that left tickets and build its results entry."""
+    logger.info('Fetching final result for: %s', input_file)
+
+    job_result = fetch_job_result(
+        jobs_url, job_id, session, logger
+    )
+
+    if job_result:
+        state = job_result.get('state')
+        result_str = job_result.get('result', 'Unknown')
+        if state == 1:
+            logger.info('%s completed successfully: %s', input_file, result_str)
+        else:
+            logger.error('%s failed with state %s: %s', input_file, state, result_str)
+        return {
+            'input_file': input_file,
+            'launch_time': launch_time,
+            'completion_time': _parse_datetime(job_result.get('end_time')),
+            'state': state,
+            'result': result_str,
+            'status': 'success' if state == 1 else 'failed',
+            'ticket_times': ticket_times
+        }
+
+    logger.error('Failed to get result for %s', input_file)
+    return {
+        'input_file': input_file,
+        'launch_time': launch_time,
+        'completion_time': datetime.now(timezone.utc),
+        'state': None,
+        'result': 'Timeout or error',
+        'status': 'failed',
+        'ticket_times': ticket_times
+    }
+
+
 def monitor_jobs(
     webui_url: str,
     launched_jobs: List[Tuple[str, datetime, str]],
     session: requests.Session,
     logger: logging.Logger,
-    poll_frequency: int = 60
+    poll_frequency: int = 60,
+    on_result: Optional[Callable[[str, Dict[str, Any]], None]] = None,
+    tickets_session: Optional[requests.Session] = None
 ) -> Dict[str, Dict[str, Any]]:
     """
     Monitor all launched jobs and collect results.
+    on_result(job_id, result) is called as soon as each final result is known.
+    tickets_session is used for the tickets polls (default: session). Created with
+    raise_on_status=False, the Retry-After of an overloaded WebUI (503/429) reaches
+    the backoff below instead of being lost in a RetryError.
 
     Uses lightweight /tickets?nodetails=true to track job lifecycle:
     - A job must be seen as active (running/queued) at least once before
@@ -429,12 +677,14 @@ def monitor_jobs(
       from being misinterpreted as job completion.
     - As soon as a previously-seen job disappears from tickets, its final
       result is fetched immediately from /jobs?jobid=... (no waiting for
-      all jobs to finish first).
+      all jobs to finish first). Fetches run in a thread pool, concurrently
+      with each other and with the tickets polling.
     - On API errors, retries continue for up to 1 hour before giving up.
       An error never marks a job as finished.
     """
     results = {}
     tickets_url = f'{webui_url}/tickets?nodetails=true'
+    jobs_url = f'{webui_url}/jobs'
 
     # Build lookup and tracking state
     job_lookup = {}  # job_id -> (launch_time, input_file)
@@ -445,19 +695,33 @@ def monitor_jobs(
     active = {}                        # job_id -> first_seen_time (seen in tickets)
     ticket_times = {}                  # job_id -> {first_seen, last_seen, gone_time}
 
-    logger.info(f'Starting to monitor {len(launched_jobs)} jobs')
+    logger.info('Starting to monitor %s jobs', len(launched_jobs))
 
     api_error_start = None  # track consecutive API error window
     API_ERROR_TIMEOUT = 3600  # 1 hour
+    INITIAL_POLL_DELAY = 2  # first delay, doubled after every successful poll up to poll_frequency
+    MAX_OVERLOAD_DELAY = 300  # cap for the delay after successive 5xx and for Retry-After
+    poll_delay = min(INITIAL_POLL_DELAY, poll_frequency)
+    overload_delay = 0  # doubles with every successive 5xx answer, 0 while the WebUI is healthy
+
+    # Stays below the connection pool size of create_session_with_retries
+    executor = ThreadPoolExecutor(max_workers=min(32, len(launched_jobs)))
+    fetches = {}  # future -> job_id of final result fetches in flight
+
+    if tickets_session is None:
+        tickets_session = session
 
     while pending or active:
         try:
-            response = session.get(tickets_url, timeout=10)
+            response = tickets_session.get(tickets_url, timeout=10)
             response.raise_for_status()
             data = response.json()
 
-            # Successful call - reset error window
+            # Successful call - reset error window, back off from a short delay again after errors
+            if api_error_start is not None:
+                poll_delay = min(INITIAL_POLL_DELAY, poll_frequency)
             api_error_start = None
+            overload_delay = 0
 
             running = data.get('tickets', {}).get('running', [])
             queued = data.get('tickets', {}).get('queued', [])
@@ -472,7 +736,7 @@ def monitor_jobs(
                     active[jid] = now
                     ticket_times[jid] = {'first_seen': now, 'last_seen': now}
                     _, input_file = job_lookup[jid]
-                    logger.info(f'Job {jid} appeared in tickets: {input_file}')
+                    logger.info('Job %s appeared in tickets: %s', jid, input_file)
 
             pending -= newly_seen
 
@@ -487,46 +751,23 @@ def monitor_jobs(
                     _, input_file = job_lookup[jid]
                     active_duration = now - ticket_times[jid]['first_seen']
                     logger.info(
-                        f'Job {jid} left tickets after {int(active_duration)}s: {input_file}'
+                        'Job %s left tickets after %ds: %s',
+                        jid, int(active_duration), input_file
                     )
 
-            # Fetch results immediately for jobs that just left tickets
+            # Fetch results immediately for jobs that just left tickets,
+            # in the background so a slow history lookup does not delay the next tickets poll
             for jid in just_gone:
                 del active[jid]
                 launch_time, input_file = job_lookup[jid]
-                logger.info(f'Fetching final result for: {input_file}')
-
-                job_result = fetch_job_result(
-                    webui_url, jid, session, logger
+                future = executor.submit(
+                    _collect_job_result,
+                    jobs_url, jid, launch_time, input_file,
+                    ticket_times.get(jid), session, logger
                 )
-
-                if job_result:
-                    state = job_result.get('state')
-                    result_str = job_result.get('result', 'Unknown')
-                    if state == 1:
-                        logger.info(f'{input_file} completed successfully: {result_str}')
-                    else:
-                        logger.error(f'{input_file} failed with state {state}: {result_str}')
-                    results[jid] = {
-                        'input_file': input_file,
-                        'launch_time': launch_time,
-                        'completion_time': _parse_datetime(job_result.get('end_time')),
-                        'state': state,
-                        'result': result_str,
-                        'status': 'success' if state == 1 else 'failed',
-                        'ticket_times': ticket_times.get(jid)
-                    }
-                else:
-                    logger.error(f'Failed to get result for {input_file}')
-                    results[jid] = {
-                        'input_file': input_file,
-                        'launch_time': launch_time,
-                        'completion_time': datetime.now(timezone.utc),
-                        'state': None,
-                        'result': 'Timeout or error',
-                        'status': 'failed',
-                        'ticket_times': ticket_times.get(jid)
-                    }
+                if on_result:
+                    future.add_done_callback(lambda f, jid=jid: on_result(jid, f.result()))
+                fetches[future] = jid
 
             if not pending and not active:
                 logger.info('All jobs have completed')
@@ -537,7 +778,7 @@ def monitor_jobs(
                 status_parts.append(f'{len(pending)} waiting to appear')
             if active:
                 status_parts.append(f'{len(active)} active')
-            logger.debug(f'Job status: {", ".join(status_parts)}')
+            logger.debug('Job status: %s', ", ".join(status_parts))
 
         except Exception as e:
             now = time.time()
@@ -547,8 +788,8 @@ def monitor_jobs(
 
             if error_duration >= API_ERROR_TIMEOUT:
                 logger.error(
-                    f'Tickets API unreachable for {error_duration}s (limit {API_ERROR_TIMEOUT}s), '
-                    f'aborting monitor. Error: {e}'
+                    'Tickets API unreachable for %ds (limit %ds), aborting monitor. Error: %s',
+                    error_duration, API_ERROR_TIMEOUT, e
                 )
                 # Mark all remaining jobs as failed
                 for jid in list(pending) + list(active.keys()):
@@ -564,11 +805,33 @@ def monitor_jobs(
                     }
                 break
 
-            logger.warning(
-                f'Tickets API error ({error_duration}s of {API_ERROR_TIMEOUT}s tolerance): {e}'
-            )
+            if isinstance(e, requests.exceptions.RetryError):
+                logger.warning(
+                    'Tickets API kept answering with an error status, retries exhausted (%ds of %ds tolerance): %s',
+                    error_duration, API_ERROR_TIMEOUT, e
+                )
+            else:
+                logger.warning(
+                    'Tickets API error (%ds of %ds tolerance): %s',
+                    error_duration, API_ERROR_TIMEOUT, e
+                )
+
+            poll_delay = poll_frequency
+            if _is_server_overload(e):
+                # WebUI is under load: back off further with every 5xx, honor Retry-After (bounded)
+                overload_delay = min(overload_delay * 2 if overload_delay else poll_frequency, MAX_OVERLOAD_DELAY)
+                retry_after = _retry_after_seconds(getattr(e, 'response', None))
+                poll_delay = max(overload_delay, min(retry_after or 0, MAX_OVERLOAD_DELAY))
+                logger.info('WebUI signals load, next tickets poll in %ds', poll_delay)
 
-        time.sleep(poll_frequency)
+        time.sleep(poll_delay)
+        if api_error_start is None:
+            # Short jobs are noticed within seconds, long running ones settle at poll_frequency
+            poll_delay = min(poll_delay * 2, poll_frequency)
+
+    for future in as_completed(fetches):
+        results[fetches[future]] = future.result()
+    executor.shutdown()
 
     return results
 
@@ -586,9 +849,9 @@ def write_summary(
     )
     failed_jobs = total_jobs - successful_jobs
 
-    logger.info(f'Total jobs: {total_jobs}')
-    logger.info(f'Successful: {successful_jobs}')
-    logger.info(f'Failed: {failed_jobs}')
+    logger.info('Total jobs: %s', total_jobs)
+    logger.info('Successful: %s', successful_jobs)
+    logger.info('Failed: %s', failed_jobs)
     print(f'Total jobs: {total_jobs}', file=sys.stderr)
     print(f'Successful: {successful_jobs}', file=sys.stderr)
     print(f'Failed: {failed_jobs}', file=sys.stderr)
@@ -597,16 +860,16 @@ def write_summary(
         input_file = job_info.get('input_file', 'Unknown')
         launch_time = job_info['launch_time']
         completion_time = job_info['completion_time']
-        duration = completion_time - launch_time
+        duration_seconds = (completion_time - launch_time).total_seconds()
 
         status = job_info['status']
         result = job_info['result']
 
-        minutes = int(duration.total_seconds() // 60)
-        seconds = int(duration.total_seconds() % 60)
+        minutes, seconds = (int(part) for part in divmod(duration_seconds, 60))
 
         logger.info(
-            f'{input_file}: {status} - {result} - Duration: {minutes}m {seconds}s'
+            '%s: %s - %s - Duration: %dm %ds',
+            input_file, status, result, minutes, seconds
         )
 
     # Ticket activity report
@@ -619,12 +882,13 @@ def write_summary(
             active_min = active_secs // 60
             active_sec = active_secs % 60
             logger.info(
-                f'{input_file}: active in tickets for {active_min}m {active_sec}s'
+                '%s: active in tickets for %dm %ds',
+                input_file, active_min, active_sec
             )
         elif tt and tt.get('first_seen'):
-            logger.info(f'{input_file}: appeared in tickets but completion time unknown')
+            logger.info('%s: appeared in tickets but completion time unknown', input_file)
         else:
-            logger.info(f'{input_file}: never seen in tickets')
+            logger.info('%s: never seen in tickets', input_file)
 
     logger.info('==========================================')
 
@@ -675,7 +939,7 @@ def main() -> int:
         '--poll_frequency',
         type=int,
         default=None,
-        help='Polling frequency in seconds (default: auto-calculated or 60)'
+        help='Maximum polling interval in seconds, polls start at 2s and back off up to it (default: auto-calculated or 60)'
     )
     parser.add_argument(
         '--disable_polling',
@@ -692,6 +956,12 @@ def main() -> int:
         action='store_true',
         help='Submit all jobs in a single request as an array'
     )
+    parser.add_argument(
+        '--result_cache',
+        help='Optional JSON file persisting successful job results across runs, '
+             'inputs that already succeeded with the same wf_id and variables are not launched again '
+             '(e.g. ~/.cache/ffastrans_launcher/results.json)'
+    )
 
     args = parser.parse_args()
 
@@ -699,6 +969,8 @@ def main() -> int:
     logger.info('Starting job launcher')
 
     session = create_session_with_retries()
+    # Only the tickets poll thread uses it, one connection is enough
+    tickets_session = create_session_with_retries(pool_size=1, raise_on_status=False)
 
     try:
         input_files = load_input_file(args.input_file, logger)
@@ -715,6 +987,26 @@ def main() -> int:
             logger
         )
 
+        cached_results = {}
+        cache_keys = {}
+        result_cache = None
+        if args.result_cache:
+            result_cache = ResultCache(os.path.expanduser(args.result_cache), logger)
+            cache_keys = {
+                input_file: job_cache_key(args.wf_id, input_file, variables)
+                for input_file in input_files
+            }
+            for input_file in input_files:
+                cached = result_cache.get(cache_keys[input_file])
+                if cached and cached.get('status') == 'success':
+                    logger.info('Skipping %s, already completed successfully in an earlier run', input_file)
+                    cached_results[f'cached_{cache_keys[input_file]}'] = cached
+            input_files = [f for f in input_files if f'cached_{cache_keys[f]}' not in cached_results]
+            if not input_files:
+                logger.info('All input files already completed successfully in earlier runs')
+                write_summary(cached_results, logger)
+                return 0
+
         launched_jobs = launch_jobs(
             args.wf_id,
             input_files,
@@ -732,7 +1024,7 @@ def main() -> int:
             logger.error('No jobs were successfully launched')
             return 1
 
-        logger.info(f'Successfully launched {len(launched_jobs)} jobs')
+        logger.info('Successfully launched %s jobs', len(launched_jobs))
 
         if args.disable_polling:
             logger.info('Polling disabled, exiting after launching jobs')
@@ -743,14 +1035,22 @@ def main() -> int:
         else:
             poll_frequency = max(1, min(int(len(launched_jobs) * 0.5), 60))
         
-        logger.info(f'Using polling frequency of {poll_frequency} seconds')
+        def remember_result(job_id: str, result: Dict[str, Any]) -> None:
+            key = cache_keys.get(result['input_file'])
+            if key and result['status'] == 'success':
+                result_cache.put(key, result)
+
+        logger.info('Using polling frequency of %s seconds', poll_frequency)
         results = monitor_jobs(
             args.webui_url,
             launched_jobs,
             session,
             logger,
-            poll_frequency
+            poll_frequency,
+            on_result=remember_result if result_cache else None,
+            tickets_session=tickets_session
         )
+        results.update(cached_results)
 
         write_summary(results, logger)
 
@@ -2,7 +2,8 @@
 """
 Merge branch reports into a full report.
 Full report is created by files find and resides unmodified until the branches finished. 
-Branch reports are created by each branch at start. 
+Branch reports are created by each branch at start, either as one JSON file per branch in a directory
+or as one line per branch in a single JSONL file (--branch_report_jsonl).
 At the end of the workflow, this script merges the full report with branch reports in order to feed createaaf with complete data.
 Finds entries by original_file or remaster_file and replaces them in the full report.
 """
@@ -11,36 +12,148 @@ import sys
 import json
 import os
 import argparse
+import mmap
+from concurrent.futures import ThreadPoolExecutor
+
+# Optional: orjson parses and serializes considerably faster, fall back to the stdlib if it is not installed
+try:
+    import orjson
+
+    def json_loads(data: bytes):
+        """Parse UTF-8 JSON bytes."""
+        return orjson.loads(data)
+
+    def json_dumps(obj, indent: bool = False) -> bytes:
+        """Serialize obj to UTF-8 JSON bytes."""
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0)
+except ImportError:
+    orjson = None
+
+    def json_loads(data: bytes):
+        """Parse UTF-8 JSON bytes."""
+        return json.loads(data)
+
+    def json_dumps(obj, indent: bool = False) -> bytes:
+        """Serialize obj to UTF-8 JSON bytes."""
+        if indent:
+            return json.dumps(obj, indent=2).encode('utf-8')
+        return json.dumps(obj, separators=(',', ':')).encode('utf-8')
+
+
+UTF8_BOM = b'\xef\xbb\xbf'
+
+
+def read_json_bytes(path):
+    """Read a file as bytes without a leading UTF-8 BOM."""
+    with open(path, 'rb') as f:
+        data = f.read()
+    if data.startswith(UTF8_BOM):
+        data = data[len(UTF8_BOM):]
+    return data
+
+
+def load_full_report(path):
+    """Parse the full report. It can be large: with orjson it is parsed straight from a memory
+    map of the file, so no bytes copy of the whole file sits next to the parsed entries."""
+    if orjson is None or os.path.getsize(path) == 0:
+        return json_loads(read_json_bytes(path))
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        # All views must be released before the map closes (and before the report is replaced on Windows)
+        with memoryview(mm) as view:
+            start = len(UTF8_BOM) if view[:len(UTF8_BOM)] == UTF8_BOM else 0
+            with view[start:] as content:
+                return orjson.loads(content)
+
+
+def read_branch_report_dir(branch_report_dir):
+    """Yield (name, branch_report) for each JSON file in the directory, sorted by name.
+    Files are loaded concurrently."""
+    if not os.path.exists(branch_report_dir):
+        print(f"Error: branch_report_dir does not exist: {branch_report_dir}", file=sys.stderr)
+        sys.exit(1)
+
+    # scandir entries carry name, path and file type from the directory listing itself
+    with os.scandir(branch_report_dir) as it:
+        entries = sorted((e for e in it if e.name.endswith('.json') and e.is_file()), key=lambda e: e.name)
+
+    def load(entry):
+        return entry.name, json_loads(read_json_bytes(entry.path))
+
+    # Many small files: overlap the reads and parses in threads, map() keeps the sorted order
+    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 2)) as executor:
+        yield from executor.map(load, entries)
+
+
+def read_branch_report_jsonl(branch_report_jsonl):
+    """Yield (name, branch_report) for each line of the JSONL file in one sequential read."""
+    if not os.path.exists(branch_report_jsonl):
+        print(f"Error: branch_report_jsonl does not exist: {branch_report_jsonl}", file=sys.stderr)
+        sys.exit(1)
+
+    lines = read_json_bytes(branch_report_jsonl).splitlines()
+
+    for line_no, line in enumerate(lines, 1):
+        if not line.strip():
+            continue
+        # Each line is a single entry, wrap it like the single entry list of a branch file
+        yield f"{branch_report_jsonl}:{line_no}", [json_loads(line)]
+
+
+SCALAR_TYPES = (str, int, float, bool)
+
+
+def index_entry_values(index, entry, i):
+    """Record entry i under each of its scalar values."""
+    for value in entry.values():
+        if isinstance(value, SCALAR_TYPES):
+            index.setdefault(value, set()).add(i)
+
+
+def unindex_entry_values(index, entry, i):
+    """Forget entry i under each of its scalar values, e.g. before the entry gets replaced."""
+    for value in entry.values():
+        if isinstance(value, SCALAR_TYPES):
+            positions = index.get(value)
+            if positions is not None:
+                positions.discard(i)
+                if not positions:
+                    del index[value]
+
+
+def index_report_values(report):
+    """Map each scalar value of the report entries to the set of indexes of the entries holding it.
+    The smallest index is the entry a linear scan would find first."""
+    index = {}
+    for i, entry in enumerate(report):
+        index_entry_values(index, entry, i)
+    return index
 
 
 def main():
     parser = argparse.ArgumentParser(description="Merge branch reports into a full report.")
     parser.add_argument("--full_report", required=True, help="Path to the full report JSON file.")
-    parser.add_argument("--branch_report_dir", required=True, help="Directory containing branch report JSON files.")
+    branch_source = parser.add_mutually_exclusive_group(required=True)
+    branch_source.add_argument("--branch_report_dir", help="Directory containing branch report JSON files.")
+    branch_source.add_argument("--branch_report_jsonl", help="JSONL file containing one branch report entry per line.")
+    parser.add_argument("--indent", action="store_true", help="Write the full report indented for humans instead of compact.")
     args = parser.parse_args()
 
     full_report_path = args.full_report
-    branch_report_dir = args.branch_report_dir
 
     # Load full report
-    with open(full_report_path, 'r', encoding='utf-8-sig') as f:
-        full_report = json.load(f)
+    full_report = load_full_report(full_report_path)
 
-    # List all files in branch report directory, sorted by name
-    if not os.path.exists(branch_report_dir):
-        print(f"Error: branch_report_dir does not exist: {branch_report_dir}", file=sys.stderr)
-        sys.exit(1)
+    # value -> indexes of the full_report entries containing it, replaces a scan per branch report
+    value_index = index_report_values(full_report)
 
-    branch_files = sorted([f for f in os.listdir(branch_report_dir) if f.endswith('.json')])
+    if args.branch_report_jsonl:
+        branch_reports = read_branch_report_jsonl(args.branch_report_jsonl)
+    else:
+        branch_reports = read_branch_report_dir(args.branch_report_dir)
 
     # Process each branch report
-    for branch_file in branch_files:
-        branch_file_path = os.path.join(branch_report_dir, branch_file)
-        
-        # Read branch report
-        with open(branch_file_path, 'r', encoding='utf-8-sig') as f:
-            branch_report = json.load(f)
-
+    merged_count = 0
+    for branch_file, branch_report in branch_reports:
         # Each branch report has exactly one entry at top level
         if not isinstance(branch_report, list) or len(branch_report) != 1:
             print(f"Error: {branch_file} does not contain exactly one entry at top level", file=sys.stderr)
@@ -56,19 +169,24 @@ def main():
             match_value = branch_entry['remaster_file']
         
         # Find and replace the entry in full_report by matching the value in any key
-        found = False
-        for i, entry in enumerate(full_report):
-            if match_value in entry.values():
-                branch_entry['found_branch_report'] = True
-                full_report[i] = branch_entry
-                found = True
-                break
-
-        if not found:
+        positions = value_index.get(match_value) if isinstance(match_value, SCALAR_TYPES) else None
+        if positions:
+            i = min(positions)
+            branch_entry['found_branch_report'] = True
+            # Keep the index in step with the report: later branch reports match what is there now
+            unindex_entry_values(value_index, full_report[i], i)
+            full_report[i] = branch_entry
+            index_entry_values(value_index, branch_entry, i)
+            merged_count += 1
+        else:
             print(f"Error: value '{match_value}' from {branch_file} not found in full_report", file=sys.stderr)
             sys.exit(1)
 
 
+    if merged_count == 0:
+        print(f"[OK] No branch reports to merge, full report left unchanged: {full_report_path}")
+        return
+
     # Ensure output directory exists
     output_dir = os.path.dirname(full_report_path)
     if output_dir and not os.path.exists(output_dir):
@@ -79,10 +197,12 @@ def main():
             print(f"Error: Failed to create output directory {output_dir}: {e}", file=sys.stderr)
             sys.exit(1)
     
-    # Write updated full report
-    with open(full_report_path, 'w', encoding='utf-8') as f:
-        json.dump(full_report, f, indent=2)
-        print(f"[OK] Full report updated: {full_report_path}")
+    # Write updated full report to a temp file first, readers never see a partially written report
+    tmp_path = full_report_path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        f.write(json_dumps(full_report, indent=args.indent))
+    os.replace(tmp_path, full_report_path)
+    print(f"[OK] Full report updated: {full_report_path}")
 
 
 if __name__ == "__main__":
@@ -6,20 +6,43 @@ import os
 import sys
 import argparse
 import time
+import json
+import random
 import logging
+import threading
+from itertools import islice
 
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 LIBS_DIR = os.path.join(BASE_DIR, "libs")
 sys.path.insert(0, LIBS_DIR)
 
-from pymongo import MongoClient
+from pymongo import MongoClient, UpdateOne
 from pymongo.errors import ConnectionFailure
 
+# Clients of MongoUpsert(shared_client=True) instances by connection string. A MongoClient pools
+# its connections, so later instances in the same process skip the TCP/TLS handshake.
+_SHARED_CLIENTS = {}
+_SHARED_CLIENTS_LOCK = threading.Lock()
+
+
+def _create_client(connection_string):
+    """Create a MongoClient that keeps one connection warm in its pool."""
+    return MongoClient(connection_string, serverSelectionTimeoutMS=5000, minPoolSize=1) # 5 second timeout for server selection
+
+
+def _get_shared_client(connection_string):
+    """Return the process wide client for connection_string, creating it on first use."""
+    with _SHARED_CLIENTS_LOCK:
+        client = _SHARED_CLIENTS.get(connection_string)
+        if client is None:
+            client = _SHARED_CLIENTS[connection_string] = _create_client(connection_string)
+        return client
+
 
 class MongoUpsert:
     """A class to handle upsert operations to a MongoDB collection."""
 
-    def __init__(self, connection_string, db_name, collection_name, connect_timeout=3600, logger="database"):
+    def __init__(self, connection_string, db_name, collection_name, connect_timeout=3600, logger="database", shared_client=False):
         """
         Initializes the MongoUpsert object and connects to the database.
 
@@ -28,6 +51,8 @@ class MongoUpsert:
         :param collection_name: The name of the collection.
         :param connect_timeout: Timeout in seconds for connection retries.
         :param logger: An optional logger instance.
+        :param shared_client: Reuse one MongoClient per connection string within this process,
+                              close() then leaves it open for the next instance.
         """
         self.connection_string = connection_string
         self.db_name = db_name
@@ -35,6 +60,7 @@ class MongoUpsert:
         self.client = None
         self.db = None
         self.collection = None
+        self.shared_client = shared_client
         self.logger = logger or logging.getLogger(__name__)
         self.connect(timeout=connect_timeout)
 
@@ -52,9 +78,13 @@ class MongoUpsert:
         Raises ConnectionFailure if the connection fails after the timeout.
         """
         start_time = time.time()
+        attempt = 0
         while True:
             try:
-                self.client = MongoClient(self.connection_string, serverSelectionTimeoutMS=5000) # 5 second timeout for server selection
+                if self.shared_client:
+                    self.client = _get_shared_client(self.connection_string)
+                else:
+                    self.client = _create_client(self.connection_string)
                 # The ismaster command is cheap and does not require auth.
                 self.client.admin.command('ismaster')
                 self.db = self.client[self.db_name]
@@ -67,12 +97,17 @@ class MongoUpsert:
                     self.logger.error(f"Could not connect to MongoDB after {timeout} seconds.")
                     raise ConnectionFailure(f"Failed to connect to MongoDB after {timeout}s") from e
                 
-                self.logger.warning(f"Connection to MongoDB failed, retrying in 5 seconds... ({e})")
-                time.sleep(5)
+                # Full jitter backoff, clients waiting for a restarting server do not reconnect in lockstep
+                delay = min(random.uniform(0, min(30.0, 0.5 * 2 ** attempt)), timeout - elapsed)
+                attempt += 1
+                self.logger.warning(f"Connection to MongoDB failed, retrying in {delay:.1f} seconds... ({e})")
+                time.sleep(delay)
 
     def close(self):
-        """Closes the connection to the MongoDB database."""
-        if self.client:
+        """Closes the connection to the MongoDB database, a shared client stays open for reuse."""
+        if self.shared_client:
+            self.client = self.db = self.collection = None
+        elif self.client:
             self.client.close()
             self.logger.info("MongoDB connection closed.")
 
@@ -91,17 +126,55 @@ class MongoUpsert:
         result = self.collection.update_one(filter_query, update, upsert=True)
         return result
 
+    def bulk_upsert(self, items, batch_size=1000, ordered=True):
+        """
+        Performs many upserts with one round-trip to the server per batch.
+
+        :param items: An iterable of (filter_query, data_to_upsert) tuples, consumed lazily.
+        :param batch_size: Number of upserts sent per bulk_write.
+        :param ordered: Apply the upserts in input order, stopping at the first error. Needed when items
+                        can share a filter (e.g. successive status updates of one document): unordered,
+                        which update wins is undefined and, without a unique index, each may insert a document.
+                        Only pass False for items with distinct filters.
+        :return: A list with the BulkWriteResult (matched_count, modified_count, upserted_ids, ...)
+                 of each batch, empty if there was nothing to write.
+        """
+        if self.collection is None:
+            raise Exception("Not connected to MongoDB. Call connect() first.")
+
+        results = []
+        items = iter(items)
+        while True:
+            operations = [UpdateOne(filter_query, {"$set": data_to_upsert}, upsert=True)
+                          for filter_query, data_to_upsert in islice(items, batch_size)]
+            if not operations:
+                return results
+            results.append(self.collection.bulk_write(operations, ordered=ordered))
+            self.logger.debug(f"Bulk upserted batch of {len(operations)} documents.")
+
+
+def read_upserts(stream):
+    """Yield (filter_query, data) from newline-delimited JSON objects {"filter": ..., "data": ...}."""
+    for line in stream:
+        if line.strip():
+            entry = json.loads(line)
+            yield entry["filter"], entry["data"]
+
 def main():
     """Main function for command-line execution."""
     parser = argparse.ArgumentParser(description="Upsert data into a MongoDB collection.")
     parser.add_argument("--connection_string", required=True, help="MongoDB connection string.")
     parser.add_argument("--db_name", required=True, help="Name of the database.")
     parser.add_argument("--collection_name", required=True, help="Name of the collection.")
-    parser.add_argument("--filter_query", required=True, help="JSON string for the filter query.")
-    parser.add_argument("--data", required=True, help="JSON string of the data to upsert.")
+    parser.add_argument("--filter_query", help="JSON string for the filter query.")
+    parser.add_argument("--data", help="JSON string of the data to upsert.")
+    parser.add_argument("--stdin", action="store_true", help="Read many upserts as newline-delimited JSON objects {\"filter\": ..., \"data\": ...} from stdin instead of --filter_query/--data. They are applied in input order, so for lines with the same filter the last one wins.")
+    parser.add_argument("--batch_size", type=int, default=1000, help="Number of upserts per bulk write in --stdin mode.")
     parser.add_argument("--connect_timeout", type=int, default=3600, help="Timeout in seconds for connection retries.")
     parser.add_argument("--log_level", default="DEBUG", choices=["DEBUG", "INFO", "WARNING", "ERROR", "CRITICAL"], help="Set the logging level.")
     args = parser.parse_args()
+    if not args.stdin and (args.filter_query is None or args.data is None):
+        parser.error("--filter_query and --data are required unless --stdin is used")
 
     # Setup logging
     logging.basicConfig(level=args.log_level, format='%(asctime)s - %(levelname)s - %(message)s')
@@ -110,14 +183,22 @@ def main():
     # Example of how to use it:
     # python mongo_upsert.py --connection_string "mongodb://localhost:27017/" --db_name "my_db" --collection_name "my_collection" --filter_query '{"id": "123"}' --data '{"name": "test", "value": "456"}'
 
-    import json
-    filter_q = json.loads(args.filter_query)
-    data_to_upsert = json.loads(args.data)
+    # Many upserts in one invocation, one handshake and one round-trip per batch:
+    # python mongo_upsert.py ... --stdin < upserts.jsonl
 
     try:
         with MongoUpsert(args.connection_string, args.db_name, args.collection_name, connect_timeout=args.connect_timeout, logger=logger) as mongo_handler:
-            upsert_result = mongo_handler.upsert(filter_q, data_to_upsert)
-            logger.info(f"Upsert successful. Matched: {upsert_result.matched_count}, Modified: {upsert_result.modified_count}, Upserted ID: {upsert_result.upserted_id}")
+            if args.stdin:
+                results = mongo_handler.bulk_upsert(read_upserts(sys.stdin), batch_size=args.batch_size)
+                matched = sum(r.matched_count for r in results)
+                modified = sum(r.modified_count for r in results)
+                upserted = sum(r.upserted_count for r in results)
+                logger.info(f"Bulk upsert successful in {len(results)} batches. Matched: {matched}, Modified: {modified}, Upserted: {upserted}")
+            else:
+                filter_q = json.loads(args.filter_query)
+                data_to_upsert = json.loads(args.data)
+                upsert_result = mongo_handler.upsert(filter_q, data_to_upsert)
+                logger.info(f"Upsert successful. Matched: {upsert_result.matched_count}, Modified: {upsert_result.modified_count}, Upserted ID: {upsert_result.upserted_id}")
     except Exception as e:
         logger.critical(f"An error occurred: {e}", exc_info=True)
         sys.exit(1)
@@ -1,66 +1,192 @@
 import argparse
+import errno
+import fnmatch
 import json
+import random
 import shutil
+import threading
 import time
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-def move_file_with_retry(src: Path, dst: Path, retries=100, delay=1):
+# Moves are I/O bound (copy+unlink across volumes), threads keep disk and network busy
+DEFAULT_PARALLEL = min(32, (os.cpu_count() or 1) * 4)
+
+def retry_delay(attempt, base_delay, max_delay):
+    """Full jitter backoff: many workers failing at once (e.g. share outage) do not retry in lockstep."""
+    return random.uniform(0, min(max_delay, base_delay * 2 ** attempt))
+
+# Windows sharing/lock violations surface as PermissionError but go away once the other process lets go
+WINERROR_SHARING_VIOLATION = 32
+WINERROR_LOCK_VIOLATION = 33
+
+def is_permanent_error(e):
+    """Errors that no amount of retrying fixes: missing source, wrong kind of path, access denied."""
+    if isinstance(e, (FileNotFoundError, IsADirectoryError, NotADirectoryError)):
+        return True
+    if isinstance(e, PermissionError):
+        return getattr(e, "winerror", None) not in (WINERROR_SHARING_VIOLATION, WINERROR_LOCK_VIOLATION)
+    return False
+
+def is_single_file_error(e):
+    """Transient errors that concern one file (locked or busy) and say nothing about the share being down."""
+    if getattr(e, "winerror", None) in (WINERROR_SHARING_VIOLATION, WINERROR_LOCK_VIOLATION):
+        return True
+    return isinstance(e, OSError) and e.errno == errno.EBUSY
+
+class CircuitBreaker:
+    """
+    Shared by the move workers: after `threshold` consecutive transient failures (across files and threads)
+    further moves fail fast for `cooldown` seconds, so an outage shows up as failed moves
+    instead of every worker sleeping through its full retry budget.
+    Locked or busy single files do not count, see is_single_file_error().
+    """
+    def __init__(self, threshold=10, cooldown=60):
+        self.threshold = threshold
+        self.cooldown = cooldown
+        self._failures = 0
+        self._open_until = 0
+        self._lock = threading.Lock()
+
+    def allow(self):
+        with self._lock:
+            return time.monotonic() >= self._open_until
+
+    def record(self, success):
+        with self._lock:
+            if success:
+                self._failures = 0
+                return
+            self._failures += 1
+            if self._failures >= self.threshold:
+                print(f"{self._failures} consecutive failures, failing fast for {self.cooldown} seconds")
+                self._open_until = time.monotonic() + self.cooldown
+                self._failures = 0
+
+    def reset(self):
+        with self._lock:
+            self._failures = 0
+            self._open_until = 0
+
+BREAKER = CircuitBreaker()
+
+# st_dev of destination directories, stat'ed once per directory instead of once per file
+_DIR_DEVICES = {}
+
+def same_device(src: Path, dst_dir: Path):
+    dev = _DIR_DEVICES.get(dst_dir)
+    if dev is None:
+        dev = _DIR_DEVICES[dst_dir] = os.stat(dst_dir).st_dev
+    return os.stat(src).st_dev == dev
+
+def move_file(src: Path, dst: Path):
+    """Rename in place when src and dst share a volume, shutil.move (copy + unlink) otherwise."""
+    if same_device(src, dst.parent):
+        try:
+            os.replace(src, dst)
+            return
+        except OSError:
+            pass  # e.g. network shares reporting the same st_dev, let shutil.move sort it out
+    shutil.move(str(src), str(dst))
+
+def move_file_with_retry(src: Path, dst: Path, retries=100, base_delay=1, max_delay=30):
     for attempt in range(retries + 1):
+        if not BREAKER.allow():
+            print(f"Not moving {src}: too many consecutive failures, circuit open")
+            return False
         try:
-            shutil.move(str(src), str(dst))
+            move_file(src, dst)
+            BREAKER.record(True)
             return True
         except Exception as e:
             print(f"Failed to move {src} -> {dst}: {e}")
+            if is_permanent_error(e):
+                print("Not retrying, error is permanent.")
+                return False
+            if not is_single_file_error(e):
+                BREAKER.record(False)
             if attempt < retries:
-                print(f"Retrying in {delay} seconds...")
+                delay = retry_delay(attempt, base_delay, max_delay)
+                print(f"Retrying in {delay:.1f} seconds...")
                 time.sleep(delay)
             else:
                 print("Giving up.")
                 return False
 
-def write_json_with_retry(data, json_path: Path, retries=100, delay=1):
+def write_json_with_retry(data, json_path: Path, retries=100, base_delay=1, max_delay=30):
     for attempt in range(retries + 1):
         try:
             json_path.parent.mkdir(parents=True, exist_ok=True)
             with json_path.open("w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2)
+                # Stream the list one entry at a time, compact: no full in-memory document, no indent padding
+                f.write("[")
+                for i, item in enumerate(data):
+                    f.write(",\n" if i else "\n")
+                    f.write(json.dumps(item))
+                f.write("\n]")
             return True
         except Exception as e:
             print(f"Failed to write JSON to {json_path}: {e}")
+            if is_permanent_error(e):
+                print("Not retrying, error is permanent.")
+                return False
             if attempt < retries:
-                print(f"Retrying in {delay} seconds...")
+                delay = retry_delay(attempt, base_delay, max_delay)
+                print(f"Retrying in {delay:.1f} seconds...")
                 time.sleep(delay)
             else:
                 print("Giving up.")
                 return False
 
 
-def move_mxf_files(input_dir: str, output_dir: str, json_out: str, include_files: str = "*.mxf"):
+def iter_matching_files(input_dir: Path, patterns, counts):
+    """Yield the files of input_dir matching any of the patterns in a single directory pass.
+    counts[pattern] is incremented for the first pattern each file matches."""
+    with os.scandir(input_dir) as it:
+        for entry in it:
+            if not entry.is_file():
+                continue
+            for pattern in patterns:
+                if fnmatch.fnmatch(entry.name, pattern):
+                    counts[pattern] += 1
+                    yield Path(entry.path)
+                    break
+
+def move_mxf_files(input_dir: str, output_dir: str, json_out: str, include_files: str = "*.mxf", parallel: int = DEFAULT_PARALLEL):
     
     output_dir.mkdir(parents=True, exist_ok=True)
 
     moved_files = []
+    # Resolved once, the per file paths below are then built without any filesystem calls
+    out_abs = output_dir.resolve()
 
     patterns = [p.strip() for p in include_files.split(",")]
 
-    for pattern in patterns:
-        _files = list(input_dir.glob(pattern))
-        print(f"Found File Count: {len(_files)} for pattern: {pattern} in folder: {input_dir}")
-        for file in _files:
-            target = output_dir / file.name
-            success = move_file_with_retry(file, target, retries=1, delay=5)
+    def move(file):
+        target = output_dir / file.name
+        return file, target, move_file_with_retry(file, target, retries=1, base_delay=5)
+
+    counts = dict.fromkeys(patterns, 0)
+    with ThreadPoolExecutor(max_workers=max(1, parallel)) as executor:
+        # Files are handed to the movers while the directory is listed, map() keeps the listing order
+        for file, target, success in executor.map(move, iter_matching_files(input_dir, patterns, counts)):
             if success:
-                moved_files.append(str(target.resolve()))
+                moved_files.append(str(out_abs / file.name))
             else:
                 print(f"Failed to move {file} to {target}")
+    # The breaker only guards this batch of moves, a later batch in the same process starts closed
+    BREAKER.reset()
+
+    for pattern, count in counts.items():
+        print(f"Found File Count: {count} for pattern: {pattern} in folder: {input_dir}")
 
     if len(moved_files) == 0:
         print("No files were moved.")
         sys.exit(1)
 
-    if write_json_with_retry(moved_files, json_out, retries=1, delay=5):
+    if write_json_with_retry(moved_files, json_out, retries=1, base_delay=5):
         print(json.dumps(moved_files, indent=2))
         print("")
         print(f"Moved {len(moved_files)} files")
@@ -76,9 +202,10 @@ if __name__ == "__main__":
     parser.add_argument("--output-dir", required=True, help="Output directory to move MXF files to")
     parser.add_argument("--json-out", required=True, help="JSON file path to write moved file list")
     parser.add_argument("--include-files", default="*.mxf", help="Comma-separated list of file patterns to include (default: *.mxf)")
+    parser.add_argument("--parallel", type=int, default=DEFAULT_PARALLEL, help=f"Number of files moved concurrently (default: {DEFAULT_PARALLEL})")
     #log args
     
     args = parser.parse_args()
     print(f"Arguments: {args}")
 
-    move_mxf_files(Path(args.input_dir), Path(args.output_dir), Path(args.json_out), args.include_files)
+    move_mxf_files(Path(args.input_dir), Path(args.output_dir), Path(args.json_out), args.include_files, args.parallel)
@@ -1,7 +1,7 @@
 import argparse
+import json
 import os
 import sys
-import re
 import logging
 import traceback
 import io
@@ -9,28 +9,61 @@ import io
 # Global variable for command line arguments
 args = None
 
+LOG_MAX_BYTES = 10 * 1024 * 1024
+
+def flush_log(log_path, log_buffer):
+    """
+    Append the buffered log records to the log file in a single write and empty the buffer.
+    Concurrent runs share the log file, so each run (or server job) lands as one block and no file handle
+    is held in between. A log above LOG_MAX_BYTES is moved to <log>.1 first; best effort, on Windows the
+    rename fails while another run is appending and is simply tried again by the next run.
+    """
+    data = log_buffer.getvalue()
+    log_buffer.seek(0)
+    log_buffer.truncate()
+    if not data:
+        return
+    try:
+        if os.path.exists(log_path) and os.path.getsize(log_path) > LOG_MAX_BYTES:
+            try:
+                os.replace(log_path, log_path + ".1")
+            except OSError:
+                pass
+        with open(log_path, 'a') as f:
+            f.write(data)
+    except Exception as e:
+        print(f"Failed to write log: {e}", file=sys.stderr)
+
+def is_date_folder(name):
+    """Check for the fixed width YYYY_MM_DD pattern with plain character tests, no regex engine."""
+    return (len(name) == 10 and name[4] == '_' and name[7] == '_'
+            and name[:4].isdigit() and name[5:7].isdigit() and name[8:].isdigit())
+
+def path_depth(path):
+    """Count the named components of path by counting separators, no list is built.
+    A drive or UNC server/share counts like a folder."""
+    path = os.path.normpath(path).strip(os.sep)
+    return path.count(os.sep) + 1 if path else 0
+
 def extract_date_cardname(in_file, recursed):
     global args
-    in_file = os.path.normpath(in_file)
-    recursed = os.path.normpath(recursed)
-    
     # Check if recursed has exactly the specified number of folders
-    recursed_parts = [p for p in recursed.split(os.sep) if p]  # Filter out empty strings
-    if len(recursed_parts) != args.depth:
-        logging.error(f"Recursed path must have exactly {args.depth} folder(s), got {len(recursed_parts)}: {recursed}")
-        raise ValueError(f"Recursed path must have exactly {args.depth} folder(s), got {len(recursed_parts)}: {recursed}")
+    recursed_depth = path_depth(recursed)
+    if recursed_depth != args.depth:
+        logging.error(f"Recursed path must have exactly {args.depth} folder(s), got {recursed_depth}: {recursed}")
+        raise ValueError(f"Recursed path must have exactly {args.depth} folder(s), got {recursed_depth}: {recursed}")
     
     # Check if the pre-last part of in_file has a date pattern YYYY_MM_DD
-    path_parts = in_file.split(os.sep)
-    if len(path_parts) < 2:
+    # Only the last three components are needed, take them from the tail instead of splitting the whole path
+    head, sep, cardname = os.path.normpath(in_file).rpartition(os.sep)
+    if not sep:
         raise ValueError(f"Path does not have enough parts to check pre-last folder: {in_file}")
-    pre_last_part = path_parts[-2]  # Second to last part
-    date_pattern = re.compile(r'^\d{4}_\d{2}_\d{2}$')
-    if not date_pattern.match(pre_last_part):
-        raise ValueError(f"Pre-last part of the path does not match YYYY_MM_DD pattern: {pre_last_part}")
+    head, _, date = head.rpartition(os.sep)
+    if not is_date_folder(date):
+        raise ValueError(f"Pre-last part of the path does not match YYYY_MM_DD pattern: {date}")
 
-    logging.debug(f"Found Date Pattern in pre-last folder: {pre_last_part}")
-    device, date, cardname = path_parts[-3], path_parts[-2], path_parts[-1]
+    logging.debug("Found Date Pattern in pre-last folder: %s", date)
+    device = head.rpartition(os.sep)[2]
     
     return device, date, cardname
 
@@ -38,7 +71,7 @@ def run(in_file, out_root, recursed):
     try:
         device, date, cardname = extract_date_cardname(in_file, recursed)
     except Exception as e:
-        logging.debug(f"No Date and Cardname in: [{in_file}]")
+        logging.debug("No Date and Cardname in: [%s]", in_file)
         return 1, f"Error extracting DEVICE, DATE and CARDNAME: {e}"
 
     # Reformat date: YYYYMMDD -> YYYY_MM_DD
@@ -49,30 +82,65 @@ def run(in_file, out_root, recursed):
 
     # calculates AAF OUTPUT DIR
     target_dir = os.path.join(out_root, date_formatted)
-    logging.debug(f"Target directory: {target_dir}")
-    logging.debug(f"Target exists: {os.path.exists(target_dir)}")
-    if os.path.exists(target_dir):
-        logging.debug(f"Target is file: {os.path.isfile(target_dir)}, is dir: {os.path.isdir(target_dir)}")
+    logging.debug("Target directory: %s", target_dir)
+    if logging.getLogger().isEnabledFor(logging.DEBUG):
+        # Only stat the target for the log when debug output is wanted
+        logging.debug(f"Target exists: {os.path.exists(target_dir)}")
+        if os.path.exists(target_dir):
+            logging.debug(f"Target is file: {os.path.isfile(target_dir)}, is dir: {os.path.isdir(target_dir)}")
     try:
         os.makedirs(target_dir, exist_ok=True)
-        logging.debug(f"Created directory: {target_dir}")
+        logging.debug("Created directory: %s", target_dir)
         return 0, target_dir
     except Exception as e:
         logging.error(f"Exception in directory creation:\n{traceback.format_exc()}")
         return 3, f"Unexpected error: {e}"
 
+def serve(base_args, log_buffer):
+    """
+    Persistent worker mode: avoids one python startup per folder when driven by an orchestrator.
+    Reads one JSON job per line from stdin, keys override the command line options, e.g.
+    {"input": "d:\\watch\\CAM1\\2024_01_31\\CARD1", "recursed": "d:\\watch\\CAM1"}
+    Writes one JSON line per job to stdout: {"code": 0, "message": "<target dir or error>"}
+    The log records of each job are appended to the log file once the job is done.
+    """
+    global args
+    logging.info("Server mode: waiting for jobs on stdin")
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            args = argparse.Namespace(**{**vars(base_args), **json.loads(line)})
+            if not (args.input and args.out_root and args.recursed):
+                raise ValueError("job needs input, out_root and recursed")
+            logging.info(">>>>>>>>>>>>>> Job started:" + args.input)
+            code, message = run(args.input, args.out_root, args.recursed)
+            logging.info("<<<<<<<<<<<<< Job end: " + args.input + " -> " + message + "\n\n")
+        except Exception as e:
+            logging.error(f"Error processing job {line}: {e}")
+            code, message = 1, f"Unexpected error: {e}"
+        flush_log(base_args.log, log_buffer)
+        sys.stdout.write(json.dumps({"code": code, "message": message}) + "\n")
+        sys.stdout.flush()
+
 def main():
     global args
     parser = argparse.ArgumentParser(description="Create a folder based on input path, error if it exists.")
     parser.add_argument("--log", required=True, help="Path to log file")
-    parser.add_argument("--input", required=True, help="Input file path")
-    parser.add_argument("--out_root", required=True, help="Root output directory")
-    parser.add_argument("--recursed", required=True, help="Watch folder path")
+    parser.add_argument("--input", help="Input file path (required unless --server)")
+    parser.add_argument("--out_root", help="Root output directory (required unless --server, can be sent per job)")
+    parser.add_argument("--recursed", help="Watch folder path (required unless --server, can be sent per job)")
     parser.add_argument("--depth", required=False, help="Recursed path must consist of exactly this cound of folders", default=2, type=int)
-    parser.add_argument("--debug", default=True, action="store_true", help="Enable debug mode")
+    parser.add_argument("--debug", action="store_true", help="Enable debug mode")
+    parser.add_argument("--server", action="store_true", help="Worker mode: read JSON jobs from stdin (one per line) and print the results as JSON lines, see serve()")
     args = parser.parse_args()
+    if not args.server:
+        missing = [f"--{name}" for name in ("input", "out_root", "recursed") if not getattr(args, name)]
+        if missing:
+            parser.error("the following arguments are required: " + ", ".join(missing))
     
-    # Set up logging buffer
+    # Set up logging buffer, written to the shared log file in one append (see flush_log)
     log_buffer = io.StringIO()
     log_level = logging.DEBUG if args.debug else logging.INFO
     logger = logging.getLogger()
@@ -81,6 +149,13 @@ def main():
     formatter = logging.Formatter('%(asctime)s - %(levelname)s - %(message)s')
     handler.setFormatter(formatter)
     logger.addHandler(handler)
+
+    if args.server:
+        try:
+            serve(args, log_buffer)
+        finally:
+            flush_log(args.log, log_buffer)
+        sys.exit(0)
     
     code = 1
     message = "Unexpected error"
@@ -96,13 +171,7 @@ def main():
         message = f"Unexpected error: {e}"
     finally:
         # Write all logs to file at once, always
-        try:
-            log_size = os.path.getsize(args.log) if os.path.exists(args.log) else 0
-            mode = 'w' if log_size > 10 * 1024 * 1024 else 'a'
-            with open(args.log, mode) as f:
-                f.write(log_buffer.getvalue())
-        except Exception as e:
-            print(f"Failed to write log: {e}", file=sys.stderr)
+        flush_log(args.log, log_buffer)
     
     # defines aaf_output_dir for workflow (by printing it to stdout)
     print(message)